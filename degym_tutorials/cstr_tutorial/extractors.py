@@ -12,16 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import asdict
-from typing import Optional
+from typing import Optional, Tuple
 
 import gymnasium as gym
 import numpy as np
 from degym.extractors import (
+    FixedSizeObservation,
     InfoExtractor,
-    Observation,
     ObservationExtractor,
     RewardExtractor,
+    StepExtractor,
     TerminatedExtractor,
     TruncatedExtractor,
 )
@@ -32,29 +32,36 @@ from degym_tutorials.cstr_tutorial.action_concrete_classes import CSTRDAEAction
 from degym_tutorials.cstr_tutorial.state_concrete_classes import CSTRState
 
 
-@dataclass(frozen=True)
-class CSTRObservation(Observation):
+@dataclass(frozen=True, slots=True)
+class CSTRObservation(FixedSizeObservation):
     """In the 'CSTR Simple Reaction' example, the agent observes measurements {[A], [B], T}."""
 
+    _size = 3
+
     c_a: float
     c_b: float
     t: float
 
-    def to_np_array(self) -> NDArray[np.floating]:
-        """Concatenate all the attributes."""
-        return np.asarray(list(asdict(self).values()))
+    def write_into(self, out: NDArray) -> None:
+        """Write all the attributes into `out`."""
+        out[0] = self.c_a
+        out[1] = self.c_b
+        out[2] = self.t
 
 
 class CSTRObservationExtractor(ObservationExtractor):
     """ObservationExtractor for the 'CSTR Simple Reaction' example."""
 
-    @property
-    def observation_space(self) -> gym.spaces.Box:
-        """Return observation space for the 'CSTR Simple Reaction' example."""
-        return gym.spaces.Box(
-            low=np.array([0.0, 0.0, 0.0]),
-            high=np.array([1.0, 1.0, np.infty]),
-            shape=(3,),
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        """Build the observation space for the 'CSTR Simple Reaction' example."""
+        super().__init__(
+            observation_space=gym.spaces.Box(
+                low=np.array([0.0, 0.0, 0.0]),
+                high=np.array([1.0, 1.0, np.infty]),
+                shape=(3,),
+            )
         )
 
     def extract_observation(self, next_state: CSTRState) -> CSTRObservation:
@@ -69,6 +76,8 @@ class CSTRObservationExtractor(ObservationExtractor):
 
 
 class CSTRRewardExtractor(RewardExtractor):  # noqa: D101
+    __slots__ = ()
+
     def extract_reward(
         self, state: CSTRState, action: CSTRDAEAction, next_state: CSTRState
     ) -> float:
@@ -77,6 +86,8 @@ class CSTRRewardExtractor(RewardExtractor):  # noqa: D101
 
 
 class CSTRTerminatedExtractor(TerminatedExtractor):  # noqa: D101
+    __slots__ = ()
+
     def extract_terminated(
         self, state: CSTRState, action: CSTRDAEAction, next_state: CSTRState
     ) -> bool:
@@ -92,6 +103,8 @@ class CSTRTerminatedExtractor(TerminatedExtractor):  # noqa: D101
 
 
 class CSTRTruncatedExtractor(TruncatedExtractor):  # noqa: D101
+    __slots__ = ()
+
     def extract_truncated(
         self, state: CSTRState, action: CSTRDAEAction, next_state: CSTRState
     ) -> bool:
@@ -100,6 +113,8 @@ class CSTRTruncatedExtractor(TruncatedExtractor):  # noqa: D101
 
 
 class CSTRInfoExtractor(InfoExtractor):  # noqa: D101
+    __slots__ = ()
+
     def extract_info(
         self,
         state: Optional[CSTRState],
@@ -108,3 +123,18 @@ class CSTRInfoExtractor(InfoExtractor):  # noqa: D101
     ) -> dict:
         """Return empty dict."""
         return {}
+
+
+class CSTRStepExtractor(StepExtractor):
+    """StepExtractor for the 'CSTR Simple Reaction' example, reading the next state once."""
+
+    __slots__ = ()
+
+    def extract_step(
+        self, state: CSTRState, action: CSTRDAEAction, next_state: CSTRState
+    ) -> Tuple[float, bool, bool]:
+        """Reward is [B]; terminal only if maximum timestep reached; no truncation."""
+        non_dae_params = next_state.non_dae_params
+        reward = float(next_state.dae_state.c_b)
+        terminated = non_dae_params.timestep >= non_dae_params.max_timestep
+        return reward, terminated, False
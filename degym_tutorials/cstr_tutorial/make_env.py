@@ -29,6 +29,7 @@ from degym_tutorials.cstr_tutorial.extractors import (
     CSTRInfoExtractor,
     CSTRObservationExtractor,
     CSTRRewardExtractor,
+    CSTRStepExtractor,
     CSTRTerminatedExtractor,
     CSTRTruncatedExtractor,
 )
@@ -93,6 +94,7 @@ def make_cstr_environment(env_config: dict) -> CSTREnvironment:  # pylint: disab
     terminated_extractor = CSTRTerminatedExtractor()
     truncated_extractor = CSTRTruncatedExtractor()
     info_extractor = CSTRInfoExtractor()
+    step_extractor = CSTRStepExtractor()
     state_postprocessor = CSTRStatePostprocessor()
 
     # Instantiate CSTR Environment
@@ -109,6 +111,7 @@ def make_cstr_environment(env_config: dict) -> CSTREnvironment:  # pylint: disab
         terminated_extractor=terminated_extractor,
         seed=env_config["random_seed"],
         state_postprocessor=state_postprocessor,
+        step_extractor=step_extractor,
     )
 
     return env
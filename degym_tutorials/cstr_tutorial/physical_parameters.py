@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import asdict
+from dataclasses import fields
+from operator import attrgetter
 from typing import Any, Optional, Union
 
 import numpy as np
@@ -23,6 +24,7 @@ from pydantic import model_validator
 from pydantic.dataclasses import dataclass
 
 from degym_tutorials.cstr_tutorial.sampling import sampling_constructors
+from degym_tutorials.cstr_tutorial.sampling.sampling_strategies import SamplingStrategy
 
 
 @dataclass(frozen=True)
@@ -64,7 +66,13 @@ class CSTRPhysicalParameters(PhysicalParameters):
 
     def to_np_array(self) -> NDArray[np.floating]:
         """Concatenate all the attributes."""
-        return np.asarray(list(asdict(self).values()))
+        return np.array(_get_physical_parameter_values(self), dtype=np.float64)
+
+
+# Fetches all the fields of a CSTRPhysicalParameters as a tuple, in declaration order
+_get_physical_parameter_values = attrgetter(
+    *(field.name for field in fields(CSTRPhysicalParameters))
+)
 
 
 class CSTRPhysicalParametersGeneratorConfig(PydanticBaseModel):
@@ -114,6 +122,21 @@ class CSTRPhysicalParametersGenerator(PhysicalParametersGenerator):
         """
         self._fixed_parameters = config.fixed_values
         self._sampled_parameters = config.sampled_values
+        # The sampling strategy of each sampled parameter is looked up once, here, rather than
+        # on every episode.
+        self._sampling_plan: list[tuple[str, type[SamplingStrategy], dict[str, Any]]] = [
+            (
+                param_name,
+                sampling_constructors.get_strategy(sampling_config["distribution"]),
+                sampling_config,
+            )
+            for param_name, sampling_config in (self._sampled_parameters or {}).items()
+        ]
+        # Without sampled values every episode gets the same parameters; they are frozen, so a
+        # single instance is built here and shared by all the episodes.
+        self._deterministic_parameters: Optional[CSTRPhysicalParameters] = None
+        if not self._sampled_parameters:
+            self._deterministic_parameters = self._build_parameters(self._fixed_parameters)
 
     def _sample_variable_parameters(self, rng: np.random.Generator) -> dict[str, Any]:
         """
@@ -124,15 +147,39 @@ class CSTRPhysicalParametersGenerator(PhysicalParametersGenerator):
             rng: Random number generator to use for sampling.
         """
         sampled_parameters: dict[str, Union[int, float, np.array]] = {}
-        if self._sampled_parameters is None:
-            return sampled_parameters
-
-        for param_name, sampling_config in self._sampled_parameters.items():
-            sampling_strategy = sampling_constructors.get_strategy(sampling_config["distribution"])
+        for param_name, sampling_strategy, sampling_config in self._sampling_plan:
             sampling_strategy_instance = sampling_strategy(rng, sampling_config)
             sampled_parameters[param_name] = sampling_strategy_instance.sample()
         return sampled_parameters
 
+    def generate_batch(self, n: int, rng: np.random.Generator) -> list[CSTRPhysicalParameters]:
+        """
+        Generate n sets of physical parameters, with a single draw per sampled parameter.
+
+        Each sampled parameter is drawn for all the n sets at once, so the sets are not the same
+        as the ones n calls to generate() would return, whose draws alternate between parameters.
+
+        Args:
+            n: Number of sets of physical parameters to generate.
+            rng: Random number generator to use for sampling.
+        """
+        if self._deterministic_parameters is not None:
+            return [self._deterministic_parameters] * n
+
+        sampled_batches: dict[str, NDArray] = {}
+        for param_name, sampling_strategy, sampling_config in self._sampling_plan:
+            batch_config = dict(sampling_config)
+            if "size" in batch_config:
+                batch_config["size"] = _batch_size(n, batch_config["size"])
+            sampled_batches[param_name] = sampling_strategy(rng, batch_config).sample()
+
+        batch = []
+        for i in range(n):
+            values = self._fixed_parameters.copy()
+            values.update({name: sampled[i] for name, sampled in sampled_batches.items()})
+            batch.append(self._build_parameters(values))
+        return batch
+
     def generate(self, rng: np.random.Generator) -> CSTRPhysicalParameters:
         """
         Generate and return a set of physical parameters sampled for this episode.
@@ -142,8 +189,15 @@ class CSTRPhysicalParametersGenerator(PhysicalParametersGenerator):
         Args:
             rng: Random number generator to use for sampling.
         """
+        if self._deterministic_parameters is not None:
+            return self._deterministic_parameters
         values = self._fixed_parameters.copy()
         values.update(self._sample_variable_parameters(rng))
+        return self._build_parameters(values)
+
+    @staticmethod
+    def _build_parameters(values: dict[str, Any]) -> CSTRPhysicalParameters:
+        """Validate the values of all the physical parameters into a CSTRPhysicalParameters."""
         return CSTRPhysicalParameters(
             p=values["p"],
             c_a_0=values["c_a_0"],
@@ -160,3 +214,10 @@ class CSTRPhysicalParametersGenerator(PhysicalParametersGenerator):
             q_max=values["q_max"],
             max_timestep=values["max_timestep"],
         )
+
+
+def _batch_size(n: int, size: Any) -> Union[int, tuple[int, ...]]:
+    """Return the size of a draw of n samples of the given size, stacked on a leading axis."""
+    if size is None:
+        return n
+    return (n, *np.atleast_1d(size).tolist())
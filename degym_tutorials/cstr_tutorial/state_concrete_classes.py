@@ -14,16 +14,19 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 import numpy as np
 from degym.state import (
     DAEParameters,
     DAEState,
+    IdentityStatePostprocessor,
+    IdentityStatePreprocessor,
     InitialStateGenerator,
     State,
-    StatePostprocessor,
-    StatePreprocessor,
 )
 from numpy.typing import NDArray
+from pydantic import ConfigDict
 
 from degym_tutorials.cstr_tutorial.physical_parameters import CSTRPhysicalParameters
 
@@ -62,6 +65,10 @@ class CSTRDAEState(DAEState):
             ]
         )
 
+    def write_into(self, out: NDArray) -> None:
+        """Write all the attributes into `out`."""
+        out[:] = (self.c_a, self.c_b, self.T)
+
     @classmethod
     def from_np_array(cls, np_array: NDArray) -> "DAEState":
         """Return a new instance of the class from a numpy array."""
@@ -91,6 +98,9 @@ class CSTRDAEParameters(DAEParameters):
         R: Ideal gas constant, from Eq. (4).
     """
 
+    # The same parameters object is carried through the whole episode
+    model_config = ConfigDict(frozen=True)
+
     F: float  # m³/min from Eq. (1)
     V: float  # m³ from Eq. (1)
     c_a_0: float  # kmol/m³ from Eq. (1)
@@ -104,24 +114,7 @@ class CSTRDAEParameters(DAEParameters):
     E_a_B: float  # Activation energy for reaction B -> A, from Eq. (4)
     R: float  # Ideal gas constant, from Eq. (2)
 
-    def to_np_array(self) -> NDArray:
-        """Concatenate all the attributes."""
-        return np.asarray(
-            [
-                self.F,
-                self.V,
-                self.c_a_0,
-                self.p,
-                self.c_p,
-                self.T_0,
-                self.dh,
-                self.k_0_a,
-                self.k_0_b,
-                self.E_a_A,
-                self.E_a_B,
-                self.R,
-            ]
-        )
+    # to_np_array() and write_into() are inherited, laying out the fields in declaration order
 
     @classmethod
     def from_np_array(cls, np_array: NDArray) -> "DAEParameters":
@@ -177,21 +170,25 @@ class CSTRNonDAEParameters(DAEParameters):
         )
 
 
-class CSTRStatePreprocessor(StatePreprocessor):  # noqa: D101
-    def preprocess_state(self, state: CSTRState) -> CSTRState:
-        """Preprocess the state."""
-        return state
+class CSTRStatePreprocessor(IdentityStatePreprocessor):
+    """No preprocessing for the state in the CSTR problem."""
 
 
-class CSTRStatePostprocessor(StatePostprocessor):  # noqa: D101
-    def postprocess_state(self, state: CSTRState) -> CSTRState:
-        """No preprocessing for the state in the CSTR problem."""
-        return state
+class CSTRStatePostprocessor(IdentityStatePostprocessor):
+    """No postprocessing for the state in the CSTR problem."""
 
 
 class CSTRInitialStateGenerator(InitialStateGenerator):
     """InitialStateGenerator class for the CSTR problem."""
 
+    def __init__(self) -> None:
+        # The DAE parameters are frozen, so those of the last physical parameters are kept and
+        # shared by the following episodes for as long as the physical parameters do not change.
+        # The DAE state and the non-DAE parameters are updated during an episode, so they are
+        # built anew on every call.
+        self._last_physical_parameters: Optional[CSTRPhysicalParameters] = None
+        self._last_dae_params: Optional[CSTRDAEParameters] = None
+
     def generate(self, physical_parameters: CSTRPhysicalParameters) -> CSTRState:
         """Return the initial state given a set of physical parameters for the system."""
         dae_state = CSTRDAEState(
@@ -200,7 +197,22 @@ class CSTRInitialStateGenerator(InitialStateGenerator):
             T=physical_parameters.T_0,
         )
 
-        dae_params = CSTRDAEParameters(
+        if self._last_dae_params is None or physical_parameters != self._last_physical_parameters:
+            self._last_dae_params = self._dae_params(physical_parameters)
+            self._last_physical_parameters = physical_parameters
+        dae_params = self._last_dae_params
+
+        non_dae_params = CSTRNonDAEParameters(
+            q_max=physical_parameters.q_max,
+            max_timestep=physical_parameters.max_timestep,
+            timestep=0,
+        )
+        return CSTRState(dae_state=dae_state, dae_params=dae_params, non_dae_params=non_dae_params)
+
+    @staticmethod
+    def _dae_params(physical_parameters: CSTRPhysicalParameters) -> CSTRDAEParameters:
+        """Return the DAE parameters given a set of physical parameters for the system."""
+        return CSTRDAEParameters(
             F=physical_parameters.F,
             V=physical_parameters.V,
             c_a_0=physical_parameters.c_a_0,
@@ -214,9 +226,3 @@ class CSTRInitialStateGenerator(InitialStateGenerator):
             E_a_B=physical_parameters.e_b,
             R=physical_parameters.R,
         )
-        non_dae_params = CSTRNonDAEParameters(
-            q_max=physical_parameters.q_max,
-            max_timestep=physical_parameters.max_timestep,
-            timestep=0,
-        )
-        return CSTRState(dae_state=dae_state, dae_params=dae_params, non_dae_params=non_dae_params)
@@ -12,16 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import MutableSequence, Union
+
 import numpy as np
 from degym.system_dynamics import DiffeqpySystemDynamicsFn
 from numpy.typing import NDArray
 
-from degym_tutorials.cstr_tutorial.action_concrete_classes import CSTRDAEAction
 from degym_tutorials.cstr_tutorial.cstr_utils import reaction_rate
-from degym_tutorials.cstr_tutorial.state_concrete_classes import (
-    CSTRDAEParameters,
-    CSTRDAEState,
-)
 
 
 class CSTRDiffeqpySystemDynamics(DiffeqpySystemDynamicsFn):  # noqa: D101
@@ -31,7 +28,7 @@ class CSTRDiffeqpySystemDynamics(DiffeqpySystemDynamicsFn):  # noqa: D101
 
     @staticmethod
     def __call__(
-        derivative: list[float],
+        derivative: Union[MutableSequence[float], NDArray[np.floating]],
         input_values: NDArray[np.floating],
         parameters: NDArray[np.floating],
         time: NDArray[np.floating],
@@ -39,6 +36,9 @@ class CSTRDiffeqpySystemDynamics(DiffeqpySystemDynamicsFn):  # noqa: D101
         """
         We implement the DAE describing the dynamics of the CSTR problem.
 
+        The parameters are the fields of CSTRDAEParameters, in the order of its to_np_array,
+        followed by the heat q of CSTRDAEAction.
+
         With:
             k_a = k_0_a * exp(-e_a / rt)
             k_b = k_0_b * exp(-e_b / rt)
@@ -49,18 +49,17 @@ class CSTRDiffeqpySystemDynamics(DiffeqpySystemDynamicsFn):  # noqa: D101
             (3): dT/dt = (F * p * c_p (T_0 - T) + q - dh * V
                             * (k_a * c_a - k_b * c_b)) / (p * c_p * V)
         """
-        s = CSTRDAEState.from_np_array(input_values)  # dae state
-        pm = CSTRDAEParameters.from_np_array(parameters[:-1])  # dae parameters
-        a = CSTRDAEAction.from_np_array(parameters[-1:])  # dae action
+        # Unpack the values into Python floats directly: building the pydantic state classes
+        # on every evaluation of the dynamics would dominate the cost of the Julia callback.
+        c_a, c_b, T = input_values  # dae state
+        F, V, c_a_0, p, c_p, T_0, dh, k_0_a, k_0_b, E_a_A, E_a_B, R, q = parameters
 
-        k_a = reaction_rate(k_0=pm.k_0_a, e=pm.E_a_A, r=pm.R, t=s.T)
-        k_b = reaction_rate(k_0=pm.k_0_b, e=pm.E_a_B, r=pm.R, t=s.T)
+        k_a = reaction_rate(k_0=k_0_a, e=E_a_A, r=R, t=T)
+        k_b = reaction_rate(k_0=k_0_b, e=E_a_B, r=R, t=T)
 
         # Differential equations.
-        derivative[0] = (
-            (pm.F / pm.V) * (pm.c_a_0 - s.c_a) - (k_a * s.c_a) + (k_b * s.c_b)
-        )  # d[A]/dt
-        derivative[1] = (pm.F / pm.V) * (-s.c_b) + (k_a * s.c_a) - (k_b * s.c_b)  # d[B]/dt
-        derivative[2] = (
-            pm.F * pm.p * pm.c_p * (pm.T_0 - s.T) + a.q - pm.dh * pm.V * (k_a * s.c_a - k_b * s.c_b)
-        ) / (pm.p * pm.c_p * pm.V)  # dT/dt
+        derivative[0] = (F / V) * (c_a_0 - c_a) - (k_a * c_a) + (k_b * c_b)  # d[A]/dt
+        derivative[1] = (F / V) * (-c_b) + (k_a * c_a) - (k_b * c_b)  # d[B]/dt
+        derivative[2] = (F * p * c_p * (T_0 - T) + q - dh * V * (k_a * c_a - k_b * c_b)) / (
+            p * c_p * V
+        )  # dT/dt
@@ -12,21 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+from typing import Callable, Optional
+
 import numpy as np
 from degym.system_dynamics import ScipySystemDynamicsFn
 from numpy.typing import NDArray
 
-from degym_tutorials.cstr_tutorial.action_concrete_classes import CSTRDAEAction
-from degym_tutorials.cstr_tutorial.cstr_utils import reaction_rate
-from degym_tutorials.cstr_tutorial.state_concrete_classes import (
-    CSTRDAEParameters,
-    CSTRDAEState,
-)
-
 
 class CSTRScipySystemDynamics(ScipySystemDynamicsFn):  # noqa: D101
-    @staticmethod
     def __call__(
+        self,
         state: NDArray[np.floating],
         parameters: NDArray[np.floating],
         action: NDArray[np.floating],
@@ -35,6 +31,8 @@ class CSTRScipySystemDynamics(ScipySystemDynamicsFn):  # noqa: D101
         """
         We implement the DAE describing the dynamics of the CSTR problem.
 
+        The parameters are the fields of CSTRDAEParameters, in the order of its to_np_array,
+        and the action holds the heat q of CSTRDAEAction.
 
         With:
             k_a = k_0_a * exp(-e_a / rt)
@@ -45,19 +43,74 @@ class CSTRScipySystemDynamics(ScipySystemDynamicsFn):  # noqa: D101
             (2): dc_b/dt = (F / V) * (− c_b) + k_a c_a  - k_b * c_b
             (3): dT/dt = (F * p * c_p (T_0 - T) + q - dh * V
                             * (k_a * c_a - k_b * c_b)) / (p * c_p * V)
+
+        The equations are implemented once, in bind().
+        """
+        return self.bind(parameters, action)(time, state)
+
+    def bind(
+        self, parameters: NDArray[np.floating], action: NDArray[np.floating]
+    ) -> Callable[[float, NDArray[np.floating]], NDArray[np.floating]]:
+        """
+        Return the right-hand side of the CSTR ODE for fixed parameters and action.
+
+        The parameters and action are unpacked into Python floats and the products of
+        parameters are computed once per integration, instead of once per evaluation.
+        """
+        F, V, c_a_0, p, c_p, T_0, dh, k_0_a, k_0_b, E_a_A, E_a_B, R = parameters.tolist()
+        (q,) = action.tolist()  # dae action
+        dilution_rate = F / V
+        heat_flow_factor = F * p * c_p
+        reaction_heat_factor = dh * V
+        heat_capacity = p * c_p * V
+        exp = math.exp
+
+        def cstr_rhs(time: float, state: NDArray[np.floating]) -> NDArray[np.floating]:
+            c_a, c_b, T = state.tolist()  # dae state
+            net_rate = k_0_a * exp(-E_a_A / (R * T)) * c_a - k_0_b * exp(-E_a_B / (R * T)) * c_b
+            return np.array(
+                [
+                    dilution_rate * (c_a_0 - c_a) - net_rate,  # d[A]/dt
+                    dilution_rate * (-c_b) + net_rate,  # d[B]/dt
+                    (heat_flow_factor * (T_0 - T) + q - reaction_heat_factor * net_rate)
+                    / heat_capacity,  # dT/dt
+                ]
+            )
+
+        return cstr_rhs
+
+    def bind_jacobian(
+        self, parameters: NDArray[np.floating], action: NDArray[np.floating]
+    ) -> Optional[Callable[[float, NDArray[np.floating]], NDArray[np.floating]]]:
         """
-        s = CSTRDAEState.from_np_array(state)  # dae state
-        pm = CSTRDAEParameters.from_np_array(parameters)  # dae parameters
-        a = CSTRDAEAction.from_np_array(action)  # dae action
+        Return the analytic Jacobian of the CSTR ODE for fixed parameters and action.
 
-        k_a = reaction_rate(k_0=pm.k_0_a, e=pm.E_a_A, r=pm.R, t=s.T)
-        k_b = reaction_rate(k_0=pm.k_0_b, e=pm.E_a_B, r=pm.R, t=s.T)
+        With r = k_a * c_a - k_b * c_b the net reaction rate, and using
+        dk_a/dT = k_a * E_a_A / (R * T^2), dk_b/dT = k_b * E_a_B / (R * T^2):
+            dr/dc_a = k_a, dr/dc_b = -k_b
+            dr/dT = (k_a * c_a * E_a_A - k_b * c_b * E_a_B) / (R * T^2)
+        and the rows of the Jacobian of [c_a, c_b, T] follow from equations (1) to (3).
+        """
+        F, V, c_a_0, p, c_p, T_0, dh, k_0_a, k_0_b, E_a_A, E_a_B, R = parameters.tolist()
+        dilution_rate = F / V
+        reaction_heat_factor = dh / (p * c_p)
+        exp = math.exp
 
-        # Differential equations.
-        delta_c_a = (pm.F / pm.V) * (pm.c_a_0 - s.c_a) - (k_a * s.c_a) + (k_b * s.c_b)  # d[A]/dt
-        delta_c_b = (pm.F / pm.V) * (-s.c_b) + (k_a * s.c_a) - (k_b * s.c_b)  # d[B]/dt
-        delta_T = (
-            pm.F * pm.p * pm.c_p * (pm.T_0 - s.T) + a.q - pm.dh * pm.V * (k_a * s.c_a - k_b * s.c_b)
-        ) / (pm.p * pm.c_p * pm.V)  # dT/dt
+        def cstr_jacobian(time: float, state: NDArray[np.floating]) -> NDArray[np.floating]:
+            c_a, c_b, T = state.tolist()
+            k_a = k_0_a * exp(-E_a_A / (R * T))
+            k_b = k_0_b * exp(-E_a_B / (R * T))
+            net_rate_dT = (k_a * c_a * E_a_A - k_b * c_b * E_a_B) / (R * T * T)
+            return np.array(
+                [
+                    [-dilution_rate - k_a, k_b, -net_rate_dT],
+                    [k_a, -dilution_rate - k_b, net_rate_dT],
+                    [
+                        -reaction_heat_factor * k_a,
+                        reaction_heat_factor * k_b,
+                        -dilution_rate - reaction_heat_factor * net_rate_dT,
+                    ],
+                ]
+            )
 
-        return np.array([delta_c_a, delta_c_b, delta_T])
+        return cstr_jacobian
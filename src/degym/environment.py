@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from typing import Optional, Tuple, final
 
 import gymnasium as gym
@@ -21,10 +21,12 @@ from numpy.typing import NDArray
 
 from degym.action import ActionPreprocessor, DAEAction, RawActionType
 from degym.extractors import (
+    CompositeStepExtractor,
     InfoExtractor,
     Observation,
     ObservationExtractor,
     RewardExtractor,
+    StepExtractor,
     TerminatedExtractor,
     TruncatedExtractor,
 )
@@ -33,16 +35,18 @@ from degym.physical_parameters import PhysicalParametersGenerator
 from degym.state import (
     DAEParameters,
     DAEState,
+    IdentityStatePostprocessor,
+    IdentityStatePreprocessor,
     InitialStateGenerator,
     NonDAEParameters,
     State,
     StatePostprocessor,
     StatePreprocessor,
 )
-from degym.utils import NoOverrideMeta, no_override
+from degym.utils import NoOverrideMixin, no_override
 
 
-class Environment(gym.Env, metaclass=NoOverrideMeta):
+class Environment(NoOverrideMixin, gym.Env, ABC):
     """Environment class forms the interface between the agent and the environment."""
 
     @final
@@ -61,6 +65,7 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
         truncated_extractor: TruncatedExtractor,
         info_extractor: InfoExtractor,
         seed: int,
+        step_extractor: Optional[StepExtractor] = None,
     ) -> None:
         """
         Initialize a DEgym environment for chemical and biological reactor simulations.
@@ -103,6 +108,10 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
             seed: Random seed for reproducible environment behavior. Controls random
                 number generation for parameter sampling, initial state generation,
                 and any stochastic processes within the environment.
+            step_extractor: Optional extractor computing reward, terminated and truncated
+                together, so that an implementation can read the next state only once.
+                When given, step() uses it instead of the reward, terminated and truncated
+                extractors; by default these three are combined in a CompositeStepExtractor.
 
         Note:
             All components except the integrator are use-case-specific and must be
@@ -119,11 +128,26 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
         self._action_preprocessor = action_preprocessor
         self._state_preprocessor = state_preprocessor
         self._state_postprocessor = state_postprocessor
+        # Identity state processors are skipped in the step pipeline
+        self._skip_state_preprocessing = (
+            type(state_preprocessor).preprocess_state is IdentityStatePreprocessor.preprocess_state
+        )
+        self._skip_state_postprocessing = (
+            type(state_postprocessor).postprocess_state
+            is IdentityStatePostprocessor.postprocess_state
+        )
         self._observation_extractor = observation_extractor
         self._reward_extractor = reward_extractor
         self._terminated_extractor = terminated_extractor
         self._truncated_extractor = truncated_extractor
         self._info_extractor = info_extractor
+        if step_extractor is None:
+            step_extractor = CompositeStepExtractor(
+                reward_extractor=reward_extractor,
+                terminated_extractor=terminated_extractor,
+                truncated_extractor=truncated_extractor,
+            )
+        self._step_extractor = step_extractor
         self._seed = seed
         self._initial_state_generator = initial_state_generator
         self._rng = np.random.default_rng(seed)
@@ -137,6 +161,19 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
         # Initialize time and step counter
         self._current_time: float = 0.0
         self._step_counter: int = 0
+        # Buffers passing the DAE state and parameters to the integrator and receiving the
+        # integrated DAE state values, reused across steps
+        self._dae_state_buffer: NDArray[np.floating] = np.empty_like(
+            self._state.dae_state.to_np_array(), dtype=np.float64
+        )
+        self._dae_params_buffer: NDArray[np.floating] = np.empty_like(
+            self._state.dae_params.to_np_array(), dtype=np.float64
+        )
+        self._next_dae_state_buffer: NDArray[np.floating] = np.empty_like(self._dae_state_buffer)
+        # Template fixing the shape and dtype of the observation arrays returned by step()
+        self._observation_template: NDArray = self._observation_extractor.extract_observation(
+            next_state=self._state
+        ).to_np_array()
 
     @final
     @no_override
@@ -154,26 +191,22 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
             truncated: Whether the episode was truncated due to a time limit.
             info: Info dictionary returned by the environment after applying the action.
         """
-        # Preprocess (state, action) before passing to integrator
-        preprocessed_state = self._state_preprocessor.preprocess_state(self.state)
-        dae_action = self._action_preprocessor.preprocess_action(action, self.state)
+        state = self._state
+        # Preprocess action before passing to integrator
+        dae_action = self._action_preprocessor.preprocess_action(action, state)
         # Calculate time span for this step
         time_span = self._calculate_time_span()
 
-        # Use integrator to solve for next state
-        next_state = self._compute_next_state(
-            state=preprocessed_state, dae_action=dae_action, time_span=time_span
-        )
-        # Postprocess next environment state
-        postprocessed_next_state = self._state_postprocessor.postprocess_state(next_state)
+        # Preprocess, integrate and postprocess the state in one pass
+        next_state = self._step_pipeline(state=state, dae_action=dae_action, time_span=time_span)
 
         # Extract outputs
         observation_array, reward, terminated, truncated, info = self._extract_step_outputs(
-            state=self.state, action=dae_action, next_state=postprocessed_next_state
+            state=state, action=dae_action, next_state=next_state
         )
 
         # Update internal state tracking: state, time, and step count
-        self._state = postprocessed_next_state
+        self._state = next_state
         self._current_time = time_span.end_time
         self._step_counter += 1
         return observation_array, reward, terminated, truncated, info
@@ -221,18 +254,43 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
             info: Info dictionary returned by the environment.
         """
         observation = self._observation_extractor.extract_observation(next_state=next_state)
-        reward = self._reward_extractor.extract_reward(
-            state=state, action=action, next_state=next_state
-        )
-        terminated = self._terminated_extractor.extract_terminated(
-            state=state, action=action, next_state=next_state
-        )
-        truncated = self._truncated_extractor.extract_truncated(
+        reward, terminated, truncated = self._step_extractor.extract_step(
             state=state, action=action, next_state=next_state
         )
         info = self._info_extractor.extract_info(state=state, action=action, next_state=next_state)
 
-        return observation.to_np_array(), reward, terminated, truncated, info
+        # A fresh array is handed out on every step, as agents commonly keep past observations
+        observation_array = np.empty_like(self._observation_template)
+        observation.write_into(observation_array)
+        return observation_array, reward, terminated, truncated, info
+
+    @final
+    @no_override
+    def _step_pipeline(self, state: State, dae_action: DAEAction, time_span: TimeSpan) -> State:
+        """
+        Run the state preprocessor, the integrator and the state postprocessor back to back.
+
+        The intermediate states (preprocessed state and raw next state) are only passed from one
+        stage to the next and are never stored on the environment, so they can be released as soon
+        as the following stage has consumed them. State processors that are identities
+        (IdentityStatePreprocessor, IdentityStatePostprocessor) are not called at all.
+
+        Args:
+            state: The state at the beginning of the step.
+            dae_action: The action taken in the step.
+            time_span: The time span of the step.
+
+        Returns:
+            next_state: The postprocessed next state of the environment.
+        """
+        if not self._skip_state_preprocessing:
+            state = self._state_preprocessor.preprocess_state(state)
+        next_state = self._compute_next_state(
+            state=state, dae_action=dae_action, time_span=time_span
+        )
+        if not self._skip_state_postprocessing:
+            next_state = self._state_postprocessor.postprocess_state(next_state)
+        return next_state
 
     @abstractmethod
     def _calculate_time_span(self) -> TimeSpan:
@@ -255,8 +313,10 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
             next_dae_state: The next DAE state of the environment.
         """
         # Prepare state and action for use with integrator
-        dae_state_array = state.dae_state.to_np_array()
-        dae_parameters_array = state.dae_params.to_np_array()
+        dae_state_array = self._dae_state_buffer
+        state.dae_state.write_into(dae_state_array)
+        dae_parameters_array = self._dae_params_buffer
+        state.dae_params.write_into(dae_parameters_array)
         dae_action_array = dae_action.to_np_array()
 
         # Compute updated DAEState values using integrator
@@ -265,6 +325,7 @@ class Environment(gym.Env, metaclass=NoOverrideMeta):
             parameters=dae_parameters_array,
             action=dae_action_array,
             time_span=time_span,
+            out=self._next_dae_state_buffer,
         )
         cls_ = state.dae_state.__class__
         return cls_.from_np_array(next_dae_state_values)
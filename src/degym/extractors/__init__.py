@@ -13,16 +13,30 @@
 # limitations under the License.
 
 from degym.extractors.info_extractor import InfoExtractor
-from degym.extractors.observation_extractor import Observation, ObservationExtractor
+from degym.extractors.linear_observation_extractor import (
+    ArrayObservation,
+    LinearObservationExtractor,
+)
+from degym.extractors.observation_extractor import (
+    FixedSizeObservation,
+    Observation,
+    ObservationExtractor,
+)
 from degym.extractors.reward_extractor import RewardExtractor
+from degym.extractors.step_extractor import CompositeStepExtractor, StepExtractor
 from degym.extractors.terminated_extractor import TerminatedExtractor
 from degym.extractors.truncated_extractor import TruncatedExtractor
 
 __all__ = [
+    "ArrayObservation",
+    "CompositeStepExtractor",
+    "FixedSizeObservation",
     "InfoExtractor",
+    "LinearObservationExtractor",
     "Observation",
     "ObservationExtractor",
     "RewardExtractor",
+    "StepExtractor",
     "TerminatedExtractor",
     "TruncatedExtractor",
 ]
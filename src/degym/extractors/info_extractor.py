@@ -88,6 +88,8 @@ class InfoExtractor(ABC):
         - Info is not used by the agent for optimization (not used in learning)
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def extract_info(
         self, state: Optional[State], action: Optional[DAEAction], next_state: Optional[State]
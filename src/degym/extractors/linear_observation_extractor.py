@@ -0,0 +1,118 @@
+# Copyright 2025 InstaDeep Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from operator import attrgetter
+from typing import Any, Dict, Sequence, Tuple
+
+import gymnasium as gym
+import numpy as np
+from numpy.typing import NDArray
+
+from degym.extractors.observation_extractor import Observation, ObservationExtractor
+from degym.state import State
+
+
+class ArrayObservation(Observation):
+    """
+    Observation holding its values directly as a numpy array.
+
+    The observation exposes the array interface of its values, so `np.asarray(observation)`
+    wraps the stored array without copying it.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: NDArray[np.float32]) -> None:
+        self._values = values
+
+    def to_np_array(self) -> NDArray[np.float32]:
+        """Return the observation values."""
+        return self._values
+
+    def write_into(self, out: NDArray) -> None:
+        """Copy the observation values into `out`."""
+        out[:] = self._values
+
+    @property
+    def __array_interface__(self) -> Dict[str, Any]:
+        """Return the array interface of the stored values."""
+        interface: Dict[str, Any] = self._values.__array_interface__
+        return interface
+
+
+class LinearObservationExtractor(ObservationExtractor):
+    """
+    Observation extractor defined declaratively by a linear transformation of state fields.
+
+    Many observations are plain affine transformations of individual state fields, e.g. a
+    measurement scaled to a reference value. Instead of hand-writing an extractor for each of
+    them, this extractor takes a specification with one `(field, scale, offset)` entry per
+    observation component and computes `value = state.<field> * scale + offset`.
+
+    The specification is compiled once at initialization: all fields are read with a single
+    attribute getter and the constants are stored as arrays, so each extraction is one gather
+    followed by one vectorized multiply-add.
+
+    Example:
+        ```python
+        extractor = LinearObservationExtractor(
+            spec=[
+                ("dae_state.c_a", 1 / 8.0, 0.0),     # Concentration of A, normalized
+                ("dae_state.T", 1 / 300.0, -1.0),    # Temperature, relative deviation
+            ],
+            observation_space=gym.spaces.Box(low=-np.inf, high=np.inf, shape=(2,)),
+        )
+        ```
+
+    Note:
+        - Fields are dotted attribute paths relative to the State
+        - Scales and offsets are constants; observations normalized by quantities stored in
+        the state itself (such as per-episode parameters) need a dedicated extractor
+    """
+
+    __slots__ = ("_spec", "_getter", "_scales", "_offsets")
+
+    def __init__(
+        self, spec: Sequence[Tuple[str, float, float]], observation_space: gym.spaces.Space
+    ) -> None:
+        """
+        Initialize the extractor from its specification.
+
+        Args:
+            spec: One `(field, scale, offset)` entry per observation component, in order.
+            observation_space: The observation space of the extracted observations.
+
+        Raises:
+            ValueError: If the specification is empty.
+        """
+        if not spec:
+            raise ValueError("The observation specification must contain at least one field.")
+        super().__init__(observation_space=observation_space)
+        fields, scales, offsets = zip(*spec)
+        self._spec = tuple(spec)
+        self._getter = attrgetter(*fields)
+        self._scales = np.asarray(scales, dtype=np.float64)
+        self._offsets = np.asarray(offsets, dtype=np.float64)
+
+    @property
+    def spec(self) -> Tuple[Tuple[str, float, float], ...]:
+        """Return the specification of the extractor."""
+        return self._spec
+
+    def extract_observation(self, next_state: State) -> ArrayObservation:
+        """Return the affine transformation of the specified state fields."""
+        values = np.array(self._getter(next_state), dtype=np.float64, ndmin=1)
+        values *= self._scales
+        values += self._offsets
+        return ArrayObservation(values.astype(np.float32))
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 from abc import ABC, abstractmethod
+from typing import ClassVar, Optional
 
 import gymnasium as gym
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 
 from degym.state import State
 
@@ -49,23 +51,34 @@ class Observation(ABC):
 
     Example:
         ```python
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class CSTRObservation(Observation):
             c_a: float  # Normalized concentration A
             c_b: float  # Normalized concentration B
             t: float    # Normalized temperature
 
-            def to_np_array(self) -> NDArray[np.floating]:
-                return np.array([self.c_a, self.c_b, self.t])
+            def to_np_array(self) -> NDArray[np.float32]:
+                # np.empty + direct indexing skips the list-to-array conversion of np.array
+                out = np.empty(3, dtype=np.float32)
+                out[0] = self.c_a
+                out[1] = self.c_b
+                out[2] = self.t
+                return out
         ```
 
     Note:
         - The observation space should be bounded and well-defined
         - Observations must be serializable to numpy arrays
+        - Observation arrays are float32, the default dtype of gymnasium Box spaces and of
+        RL libraries' buffers, which avoids a conversion on every stored observation
+        - Observations are created on every step; concrete dataclasses should be declared
+        with `@dataclass(frozen=True, slots=True)` to avoid a per-instance `__dict__`
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def to_np_array(self) -> NDArray[np.floating]:
+    def to_np_array(self) -> NDArray[np.float32]:
         """
         Convert the observation to a numpy array.
 
@@ -73,8 +86,8 @@ class Observation(ABC):
         (that can be consumed by RL agents).
 
         Returns:
-            NDArray[np.floating]: A 1D numpy array containing all observation values
-                in a consistent order. The array length should match the
+            NDArray[np.float32]: A 1D float32 numpy array containing all observation values
+                in a consistent order. The array length and dtype should match the
                 observation space defined by the ObservationExtractor.
 
         Example:
@@ -90,6 +103,86 @@ class Observation(ABC):
             ObservationExtractor.
         """
 
+    def write_into(self, out: NDArray) -> None:
+        """
+        Write the observation into a preallocated numpy array.
+
+        This is the allocation-free counterpart of to_np_array(), used by the environment
+        on every step. The default implementation copies the result of to_np_array(), so
+        it is always correct; concrete observations can override it to assign their values
+        directly and skip building the intermediate array.
+
+        Args:
+            out: A 1D numpy array with the same length as the array returned by
+                to_np_array(). For batches, pass the row to fill, e.g. `out[i]`.
+
+        Example:
+            For a CSTR observation with concentrations and temperature:
+            ```python
+            def write_into(self, out: NDArray) -> None:
+                out[0] = self.c_a
+                out[1] = self.c_b
+                out[2] = self.t
+            ```
+        """
+        out[:] = self.to_np_array()
+
+    def __array__(
+        self, dtype: Optional[DTypeLike] = None, copy: Optional[bool] = None
+    ) -> NDArray:
+        """
+        Support the NumPy array protocol, so that `np.asarray(observation)` works directly.
+
+        Args:
+            dtype: Optional dtype to convert the observation values to.
+            copy: Accepted for compatibility with the NumPy 2 array protocol and ignored. The
+                array returned by to_np_array() is passed on as is, so whether it is a copy
+                depends on the observation: ArrayObservation, for instance, returns its
+                stored values.
+
+        Returns:
+            NDArray: The observation values, as returned by to_np_array().
+        """
+        array = self.to_np_array()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+
+class FixedSizeObservation(Observation):
+    """
+    Observation made of a fixed number of scalar dataclass fields.
+
+    Subclasses are dataclasses setting the class attribute `_size` to their number of fields.
+    to_np_array() is derived from write_into(), which by default writes the fields in
+    declaration order; subclasses on a hot path can override write_into() with direct
+    assignments.
+
+    Example:
+        ```python
+        @dataclass(frozen=True, slots=True)
+        class CSTRObservation(FixedSizeObservation):
+            _size = 3
+
+            c_a: float  # Normalized concentration A
+            c_b: float  # Normalized concentration B
+            t: float    # Normalized temperature
+        ```
+    """
+
+    __slots__ = ()
+
+    _size: ClassVar[int]
+
+    def to_np_array(self) -> NDArray[np.float32]:
+        """Return the fields as a new 1D float32 array of length `_size`."""
+        out = np.empty(self._size, dtype=np.float32)
+        self.write_into(out)
+        return out
+
+    def write_into(self, out: NDArray) -> None:
+        """Write the fields into `out`, in declaration order."""
+        for i, field in enumerate(dataclasses.fields(self)):  # type: ignore[arg-type]
+            out[i] = getattr(self, field.name)
+
 
 class ObservationExtractor(ABC):
     """
@@ -134,12 +227,13 @@ class ObservationExtractor(ABC):
     Example:
         ```python
         class CSTRObservationExtractor(ObservationExtractor):
-            @property
-            def observation_space(self) -> gym.spaces.Box:
-                return gym.spaces.Box(
-                    low=np.array([0.0, 0.0, 0.0]),
-                    high=np.array([1.0, 1.0, 2.0]),
-                    shape=(3,)
+            def __init__(self) -> None:
+                super().__init__(
+                    observation_space=gym.spaces.Box(
+                        low=np.array([0.0, 0.0, 0.0]),
+                        high=np.array([1.0, 1.0, 2.0]),
+                        shape=(3,)
+                    )
                 )
 
             def extract_observation(self, next_state: CSTRState) -> CSTRObservation:
@@ -158,30 +252,32 @@ class ObservationExtractor(ABC):
           optimal decision-making while remaining computationally efficient
     """
 
-    @property
-    @abstractmethod
-    def observation_space(self) -> gym.spaces.Space:
+    __slots__ = ("_observation_space",)
+
+    def __init__(self, observation_space: gym.spaces.Space) -> None:
         """
-        Define the observation space for the RL environment.
+        Initialize the extractor with its observation space.
 
-        This property specifies the structure, bounds, and data types of observations
-        that will be provided to RL agents. The space definition is crucial for
-        RL algorithms to understand the expected input format and ranges.
+        The observation space is built once here and returned as-is by the observation_space
+        property, since RL libraries and wrappers query it frequently.
 
-        Returns:
-            gym.spaces.Space: A gymnasium Space object defining the observation
+        Args:
+            observation_space: A gymnasium Space object defining the observation
                 structure. Commonly a Box space for continuous observations,
                 but can be Discrete, MultiDiscrete, or other space types.
 
         Example:
             For a CSTR with normalized concentrations and temperature:
             ```python
-            return gym.spaces.Box(
-                low=np.array([0.0, 0.0, 0.0]),    # Min values
-                high=np.array([1.0, 1.0, 2.0]),   # Max values
-                shape=(3,),                        # 3D observation
-                dtype=np.float32
-            )
+            def __init__(self) -> None:
+                super().__init__(
+                    observation_space=gym.spaces.Box(
+                        low=np.array([0.0, 0.0, 0.0]),    # Min values
+                        high=np.array([1.0, 1.0, 2.0]),   # Max values
+                        shape=(3,),                        # 3D observation
+                        dtype=np.float32
+                    )
+                )
             ```
 
         Note:
@@ -189,6 +285,21 @@ class ObservationExtractor(ABC):
             returned by extract_observation(). Violations can cause RL algorithm
             failures or suboptimal performance.
         """
+        self._observation_space = observation_space
+
+    @property
+    def observation_space(self) -> gym.spaces.Space:
+        """
+        Define the observation space for the RL environment.
+
+        This property specifies the structure, bounds, and data types of observations
+        that will be provided to RL agents. The space definition is crucial for
+        RL algorithms to understand the expected input format and ranges.
+
+        Returns:
+            gym.spaces.Space: The observation space passed at initialization.
+        """
+        return self._observation_space
 
     @abstractmethod
     def extract_observation(self, next_state: State) -> Observation:
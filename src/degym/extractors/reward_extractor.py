@@ -84,6 +84,8 @@ class RewardExtractor(ABC):
         - Rewards should be bounded and scaled appropriately for the RL algorithm
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def extract_reward(self, state: State, action: DAEAction, next_state: State) -> float:
         """
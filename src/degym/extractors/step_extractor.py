@@ -0,0 +1,133 @@
+# Copyright 2025 InstaDeep Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+from degym.action import DAEAction
+from degym.extractors.reward_extractor import RewardExtractor
+from degym.extractors.terminated_extractor import TerminatedExtractor
+from degym.extractors.truncated_extractor import TruncatedExtractor
+from degym.state import State
+
+
+class StepExtractor(ABC):
+    """
+    Abstract base class for extracting reward, terminated and truncated in a single call.
+
+    The RewardExtractor, TerminatedExtractor and TruncatedExtractor all evaluate the same
+    transition (s, a, s') and typically read the same fields of the next state. A
+    StepExtractor computes the three outputs together, so that a use-case-specific
+    implementation can read the state fields once and derive everything from local values.
+    When an Environment is given a StepExtractor, step() uses it instead of calling the three
+    extractors one after the other.
+
+    Purpose and Role:
+        - Groups the per-transition outputs of a step behind a single interface
+        - Allows implementations to fuse the three computations into one pass
+
+    Implementation Strategies:
+        - Composite: Wrap the three legacy extractors (see CompositeStepExtractor)
+        - Fused: Read the relevant state fields once and compute the three outputs from them
+
+    Example:
+        ```python
+        class CSTRStepExtractor(StepExtractor):
+            def extract_step(self, state: CSTRState, action: CSTRDAEAction,
+                             next_state: CSTRState) -> Tuple[float, bool, bool]:
+                non_dae_params = next_state.non_dae_params
+                reward = float(next_state.dae_state.c_b)
+                terminated = non_dae_params.timestep >= non_dae_params.max_timestep
+                return reward, terminated, False
+        ```
+
+    Note:
+        - The outputs must follow the same conventions as the RewardExtractor,
+        TerminatedExtractor and TruncatedExtractor
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def extract_step(
+        self, state: State, action: DAEAction, next_state: State
+    ) -> Tuple[float, bool, bool]:
+        """
+        Extract reward, terminated and truncated for a single transition (s, a, s').
+
+        Args:
+            state: The state at the beginning of the step.
+            action: The action taken in the step.
+            next_state: The state at the end of the step.
+
+        Returns:
+            reward: Reward returned for (s, a, s').
+            terminated: Whether the episode terminated due to termination conditions.
+            truncated: Whether the episode was truncated due to truncation conditions.
+        """
+
+
+class CompositeStepExtractor(StepExtractor):
+    """
+    StepExtractor delegating to separate reward, terminated and truncated extractors.
+
+    This adapter lets existing extractors be used wherever a StepExtractor is expected. It is
+    what an Environment uses when it is not given a StepExtractor.
+
+    Example:
+        ```python
+        step_extractor = CompositeStepExtractor(
+            reward_extractor=CSTRRewardExtractor(),
+            terminated_extractor=CSTRTerminatedExtractor(),
+            truncated_extractor=CSTRTruncatedExtractor(),
+        )
+        reward, terminated, truncated = step_extractor.extract_step(state, action, next_state)
+        ```
+    """
+
+    __slots__ = ("_reward_extractor", "_terminated_extractor", "_truncated_extractor")
+
+    def __init__(
+        self,
+        reward_extractor: RewardExtractor,
+        terminated_extractor: TerminatedExtractor,
+        truncated_extractor: TruncatedExtractor,
+    ) -> None:
+        """
+        Initialize the step extractor from the three extractors.
+
+        Args:
+            reward_extractor: Computes the reward of a transition.
+            terminated_extractor: Determines whether a transition terminates the episode.
+            truncated_extractor: Determines whether a transition truncates the episode.
+        """
+        self._reward_extractor = reward_extractor
+        self._terminated_extractor = terminated_extractor
+        self._truncated_extractor = truncated_extractor
+
+    def extract_step(
+        self, state: State, action: DAEAction, next_state: State
+    ) -> Tuple[float, bool, bool]:
+        """Extract the outputs with the reward, terminated and truncated extractors."""
+        return (
+            self._reward_extractor.extract_reward(
+                state=state, action=action, next_state=next_state
+            ),
+            self._terminated_extractor.extract_terminated(
+                state=state, action=action, next_state=next_state
+            ),
+            self._truncated_extractor.extract_truncated(
+                state=state, action=action, next_state=next_state
+            ),
+        )
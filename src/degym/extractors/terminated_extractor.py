@@ -83,6 +83,8 @@ class TerminatedExtractor(ABC):
         - Termination conditions should align with the problem's natural endpoints
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def extract_terminated(self, state: State, action: DAEAction, next_state: State) -> bool:
         """
@@ -81,6 +81,8 @@ class TruncatedExtractor(ABC):
         - Truncation conditions are independent of system dynamics
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def extract_truncated(self, state: State, action: DAEAction, next_state: State) -> bool:
         """
@@ -13,31 +13,46 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
 
 from degym.system_dynamics import SystemDynamicsFn
-from degym.utils import PydanticBaseModel
 
 
-class TimeSpan(PydanticBaseModel):
-    """A class for storing the start and end times of an integration step."""
+@dataclass(frozen=True, slots=True)
+class TimeSpan:
+    """
+    A class for storing the start and end times of an integration step.
+
+    A time span is created on every environment step, so it is a lightweight slotted dataclass
+    rather than a validated pydantic model. The step duration `dt` is computed once at
+    construction, so integrators can read it instead of recomputing it.
+    """
 
     start_time: float
     end_time: float
+    dt: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the duration of the step once."""
+        object.__setattr__(self, "dt", self.end_time - self.start_time)
 
 
 class IntegratorConfig(ABC):
     """A config for storing the parameters of the integrator."""
 
+    __slots__ = ()
+
 
 class Integrator(ABC):
     """Class responsible for integrating a dynamical system."""
 
     def __init__(self, system_dynamics: SystemDynamicsFn, integrator_config: IntegratorConfig):
         self._system_dynamics = system_dynamics
+        self._system_dynamics_fn = system_dynamics.as_callable()
         self._config = integrator_config
 
     @abstractmethod
@@ -47,9 +62,30 @@ class Integrator(ABC):
 
         Args:
             *args: The arguments to pass to the integrator, which may vary between integrators.
-            **kwargs: The keyword arguments to pass to the integrator.
+            **kwargs: The keyword arguments to pass to the integrator. Integrators used by the
+                Environment must accept an `out` keyword: an optional preallocated 1D array
+                that is filled in place with the results and returned, to avoid allocating
+                a new array on every step.
         Returns:
             The results of the integration, i.e. the updated values of the dae_state.
+
+        Note:
+            This method and the callbacks it creates run on every environment step, and the
+            system dynamics are evaluated many times per call. Implementations should bind
+            the dynamics and the config to local variables once, before handing them to the
+            solver, instead of reading them through `self` on every evaluation:
+            ```python
+            def integrate(self, input_values, parameters, action, time_span, out=None):
+                system_dynamics = self._system_dynamics_fn
+                config = self._config
+                solution = solve_ivp(
+                    fun=lambda time, state: system_dynamics(state, parameters, action, time),
+                    t_span=(time_span.start_time, time_span.end_time),
+                    y0=input_values,
+                    method=config.method,
+                )
+                ...
+            ```
         """
 
     @property
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import importlib.util
+from typing import Any, Callable, Optional
 
 import numpy as np
 
@@ -26,11 +27,30 @@ from degym.integrators.base import Integrator, IntegratorConfig, TimeSpan
 from degym.system_dynamics import DiffeqpySystemDynamicsFn
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffeqpyIntegratorConfig(IntegratorConfig):
-    """Config for DiffeqpyIntegrator."""
+    """
+    Config for DiffeqpyIntegrator.
+
+    The method is one of the keys of `DIFFEQPY_METHODS`. Rosenbrock methods (Rodas5, Rodas5P)
+    handle stiff problems and DAEs with a singular mass matrix, at the cost of a Jacobian
+    evaluation and a linear solve per step. Explicit Runge-Kutta methods (Tsit5, Vern7) are
+    much cheaper per step for non-stiff ODEs, but need tiny steps on stiff problems and do not
+    support singular mass matrices.
+    """
 
     action_duration: float
+    method: str = "Rodas5"  # Rosenbrock method of order 5, for stiff ODEs and DAEs
+
+
+# Factories for the DifferentialEquations.jl algorithm of each method. The algorithms are only
+# built when an integrator is created, since diffeqpy is an optional dependency.
+DIFFEQPY_METHODS: dict[str, Callable[[], Any]] = {
+    "Rodas5": lambda: de.Rodas5(autodiff=False),
+    "Rodas5P": lambda: de.Rodas5P(autodiff=False),
+    "Tsit5": lambda: de.Tsit5(),  # noqa: PLW0108
+    "Vern7": lambda: de.Vern7(),  # noqa: PLW0108
+}
 
 
 class DiffeqpyIntegrator(Integrator):
@@ -42,8 +62,35 @@ class DiffeqpyIntegrator(Integrator):
         if importlib.util.find_spec("diffeqpy") is None:
             raise ImportError("diffeqpy is not installed")
 
+        if integrator_config.method not in DIFFEQPY_METHODS:
+            raise ValueError(
+                f"Unknown diffeqpy method {integrator_config.method!r}, "
+                f"expected one of {sorted(DIFFEQPY_METHODS)}"
+            )
+
         super().__init__(system_dynamics, integrator_config)
-        self.ode_function = de.ODEFunction(system_dynamics, mass_matrix=system_dynamics.mass_matrix)
+        self._algorithm = DIFFEQPY_METHODS[integrator_config.method]()
+        self.ode_function = de.ODEFunction(
+            self._system_dynamics_fn, mass_matrix=system_dynamics.mass_matrix
+        )
+        # The solver is initialized on the first call and reinitialized with the new initial
+        # values, time span and parameters afterwards, which avoids setting up the problem and
+        # the solver caches on every step. The parameters and the action are packed into a
+        # buffer that is reused across calls, since their sizes do not change.
+        self._solver: Optional[Any] = None
+        self._parameters_buffer: Optional[NDArray[np.floating]] = None
+
+    def _pack_parameters(
+        self, parameters: NDArray[np.floating], action: NDArray[np.floating]
+    ) -> NDArray[np.floating]:
+        """Write the parameters followed by the action into the reused parameter buffer."""
+        n_parameters = parameters.size
+        buffer = self._parameters_buffer
+        if buffer is None or buffer.size != n_parameters + action.size:
+            buffer = self._parameters_buffer = np.empty(n_parameters + action.size)
+        buffer[:n_parameters] = parameters
+        buffer[n_parameters:] = action
+        return buffer
 
     def integrate(
         self,
@@ -51,6 +98,7 @@ class DiffeqpyIntegrator(Integrator):
         parameters: NDArray[np.floating],
         action: NDArray[np.floating],
         time_span: TimeSpan,
+        out: Optional[NDArray[np.floating]] = None,
     ) -> NDArray[np.floating]:
         """
         Integrate DAE over one timespan, to get updated values of time-dependent variables.
@@ -60,23 +108,50 @@ class DiffeqpyIntegrator(Integrator):
             parameters: 1D array containing parameters used in the DAE equations.
             action: 1D array containing action values used in the DAE equations
             time_span: DiffeqpyTimeSpan object containing start and end times for the integration.
+            out: Optional preallocated 1D array to write the updated values into.
         Returns:
-            next_values: 1D array of updated values of time-dependent variables.
+            next_values: 1D array of updated values of time-dependent variables (`out` if it was
+                provided).
         """
-        # Setup ODE to be solved
-        problem = de.ODEProblem(
-            self.ode_function,
-            input_values,
-            (time_span.start_time, time_span.end_time),
-            np.concatenate([parameters, action]),
-            saveat=time_span.end_time,
-        )
+        packed_parameters = self._pack_parameters(parameters, action)
+        solver = self._solver
+        if solver is None:
+            # Setup ODE to be solved, and the solver that is reused by the following calls
+            problem = de.ODEProblem(
+                self.ode_function,
+                input_values,
+                (time_span.start_time, time_span.end_time),
+                packed_parameters,
+            )
+            solver = self._solver = de.init(
+                problem,
+                self._algorithm,
+                # Only the final state is read, from the solver itself: disable all saving
+                save_everystep=False,
+                save_start=False,
+                save_on=False,
+                dense=False,
+            )
+        else:
+            # The action is part of the parameters and changes on every step, so the solver
+            # caches (e.g. the first stage derivative of FSAL methods) must be recomputed:
+            # keep reinit_cache=True.
+            solver.p = packed_parameters
+            de.reinit_b(
+                solver,
+                input_values,
+                t0=time_span.start_time,
+                tf=time_span.end_time,
+                reinit_cache=True,
+            )
 
         # Use integrator to solve for updated state
-        solution = de.solve(
-            problem,
-            de.Rodas5(autodiff=False),
-        )
-
-        next_values = np.array(de.stack(solution.u))[:, -1]
-        return next_values
+        de.solve_b(solver)
+
+        # View of the solver state in Julia memory, without copying it through Python. The
+        # solver state is overwritten by the next call, so it is copied out before returning.
+        next_values = np.asarray(solver.u)
+        if out is None:
+            return next_values.copy()
+        np.copyto(out, next_values)
+        return out
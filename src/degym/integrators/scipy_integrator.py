@@ -12,26 +12,142 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any, Callable, Literal, Optional
+
 import numpy as np
 from numpy.typing import NDArray
 from pydantic.dataclasses import dataclass
-from scipy.integrate import solve_ivp
+from scipy.integrate import BDF, DOP853, LSODA, RK23, RK45, OdeSolver, Radau
 
 from degym.integrators.base import Integrator, IntegratorConfig, TimeSpan
+from degym.system_dynamics import ScipySystemDynamicsFn
 
 
-@dataclass
+@dataclass(slots=True)
 class ScipyIntegratorConfig(IntegratorConfig):
     """Config for ScipyIntegrator."""
 
     action_duration: float
-    method: str = "RK45"  # 4th order Runge-Kutta method (explicit Runge-Kutta of order 4(5))
+    # 4th order Runge-Kutta method (explicit Runge-Kutta of order 4(5)). For dynamics that may
+    # become stiff, "LSODA" switches automatically between the Adams and BDF methods.
+    method: str = "RK45"
+    # Number of equal steps taken over each time span by the fixed-step "RK4" method. The
+    # tolerances and step size options below only apply to the adaptive scipy methods.
+    n_substeps: int = 10
     rtol: float = 1e-6  # Relative tolerance
     atol: float = 1e-8  # Absolute tolerance
+    # Looser tolerances used in "train" mode (see ScipyIntegrator.mode). Policies trained on
+    # rollouts average over much larger noise than these errors, and every order of magnitude
+    # of relative tolerance saves a large share of the steps of the explicit methods.
+    train_rtol: float = 1e-4
+    train_atol: float = 1e-6
+    max_step: float = np.inf  # Maximum step size
+    first_step: Optional[float] = None  # Initial step size, chosen by the solver if None
+    # Whether the system dynamics accept a 2D state of shape (D, K) and return derivatives of
+    # the same shape. This lets the implicit methods (Radau, BDF) evaluate all the columns of
+    # their finite-difference Jacobian in one call; the explicit methods do not benefit.
+    vectorized: bool = False
+
+
+# Solver classes of the methods accepted by ScipyIntegratorConfig, as in solve_ivp.
+SCIPY_METHODS: dict[str, type[OdeSolver]] = {
+    "RK23": RK23,
+    "RK45": RK45,
+    "DOP853": DOP853,
+    "Radau": Radau,
+    "BDF": BDF,
+    "LSODA": LSODA,
+}
+
+# Fixed-step methods implemented by ScipyIntegrator itself, without a scipy solver.
+FIXED_STEP_METHODS = ("RK4",)
 
 
 class ScipyIntegrator(Integrator):
-    """Class responsible for integrating batches of ODEs."""
+    """
+    Class responsible for integrating batches of ODEs.
+
+    The integrator drives the scipy solver classes directly rather than through solve_ivp. Only
+    the final state of each time span is needed, so the bookkeeping of solve_ivp (storing
+    every step, building the solution object) is skipped. The final states are the same.
+
+    Besides the scipy methods, the integrator implements the classical fixed-step "RK4" method,
+    which takes `n_substeps` equal steps per time span. It has no error control, but it skips
+    the setup and step size selection of the adaptive solvers, which dominate the cost of the
+    short time spans of smooth, non-stiff dynamics.
+
+    The implicit methods (Radau, BDF, LSODA) use the analytic Jacobian of the dynamics when
+    their `bind_jacobian` method provides one, and estimate it by finite differences otherwise.
+
+    The integrator runs in "eval" mode by default, with the `rtol` and `atol` of the config. In
+    "train" mode, it uses the looser `train_rtol` and `train_atol` instead, trading accuracy
+    for fewer steps while collecting training rollouts.
+    """
+
+    def __init__(
+        self, system_dynamics: ScipySystemDynamicsFn, integrator_config: ScipyIntegratorConfig
+    ):
+        method = integrator_config.method
+        if method not in SCIPY_METHODS and method not in FIXED_STEP_METHODS:
+            raise ValueError(
+                f"Unknown scipy method {method!r}, "
+                f"expected one of {sorted([*SCIPY_METHODS, *FIXED_STEP_METHODS])}"
+            )
+
+        super().__init__(system_dynamics, integrator_config)
+        # None for the fixed-step methods
+        self._solver_class = SCIPY_METHODS.get(method)
+        self._bind_fn = system_dynamics.bind
+        # The Jacobian is only used by the implicit methods; explicit ones reject it
+        self._bind_jacobian_fn = (
+            system_dynamics.bind_jacobian if self._solver_class in (Radau, BDF, LSODA) else None
+        )
+        self.mode = "eval"
+
+    @property
+    def mode(self) -> Literal["train", "eval"]:
+        """The mode selecting the tolerances of the integrator, "train" or "eval"."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: Literal["train", "eval"]) -> None:
+        config = self._config
+        if mode == "train":
+            self._rtol, self._atol = config.train_rtol, config.train_atol
+        elif mode == "eval":
+            self._rtol, self._atol = config.rtol, config.atol
+        else:
+            raise ValueError(f"Unknown mode {mode!r}, expected 'train' or 'eval'")
+        self._mode = mode
+
+    def _solve(
+        self,
+        fun: Callable[[float, NDArray[np.floating]], NDArray[np.floating]],
+        y0: NDArray[np.floating],
+        time_span: TimeSpan,
+        vectorized: bool,
+        **solver_options: Any,
+    ) -> NDArray[np.floating]:
+        """Step the solver over the time span and return the state at its end."""
+        config = self._config
+        if self._solver_class is None:
+            return _solve_rk4(fun, y0, time_span, config.n_substeps)
+        solver = self._solver_class(
+            fun,
+            time_span.start_time,
+            y0,
+            time_span.end_time,
+            rtol=self._rtol,
+            atol=self._atol,
+            max_step=config.max_step,
+            first_step=config.first_step,
+            vectorized=vectorized,
+            **solver_options,
+        )
+        # As in solve_ivp, a failed step stops the integration at the last accepted state
+        while solver.status == "running":
+            solver.step()
+        return solver.y
 
     def integrate(
         self,
@@ -39,6 +155,7 @@ class ScipyIntegrator(Integrator):
         parameters: NDArray[np.floating],
         action: NDArray[np.floating],
         time_span: TimeSpan,
+        out: Optional[NDArray[np.floating]] = None,
     ) -> NDArray[np.floating]:
         """
         Integrate system over one timespan, to get updated values of time-dependent variables.
@@ -48,18 +165,46 @@ class ScipyIntegrator(Integrator):
             parameters: 1D array containing parameters used in the DAE equations.
             action: 1D array containing action values used in the DAE equations
             time_span: DiffeqpyTimeSpan object containing start and end times for the integration.
+            out: Optional preallocated 1D array to write the updated values into.
         Returns:
-            next_values: 1D array of updated values of time-dependent variables.
+            next_values: 1D array of updated values of time-dependent variables (`out` if it was
+                provided).
         """
-        # Solve the ODE using the method specified in the config
-        solution = solve_ivp(
-            fun=lambda time, state: self.system_dynamics(state, parameters, action, time),
-            t_span=(time_span.start_time, time_span.end_time),
+        # Solve the ODE using the method specified in the config. The right-hand side is bound
+        # to the parameters and action once, as it is evaluated many times per solve.
+        solver_options: dict[str, Any] = {}
+        if self._bind_jacobian_fn is not None:
+            jacobian = self._bind_jacobian_fn(parameters, action)
+            if jacobian is not None:
+                solver_options["jac"] = jacobian
+        next_values = self._solve(
+            fun=self._bind_fn(parameters, action),
             y0=input_values,
-            method=self.config.method,
-            rtol=self.config.rtol,
-            atol=self.config.atol,
+            time_span=time_span,
+            vectorized=self._config.vectorized,
+            **solver_options,
         )
+        if out is None:
+            return next_values
+        np.copyto(out, next_values)
+        return out
+
 
-        next_values = solution.y[:, -1]
-        return next_values
+def _solve_rk4(
+    fun: Callable[[float, NDArray[np.floating]], NDArray[np.floating]],
+    y0: NDArray[np.floating],
+    time_span: TimeSpan,
+    n_substeps: int,
+) -> NDArray[np.floating]:
+    """Integrate over the time span with `n_substeps` steps of the classical Runge-Kutta method."""
+    step = time_span.dt / n_substeps
+    half_step = 0.5 * step
+    y = np.asarray(y0, dtype=np.float64)
+    for i in range(n_substeps):
+        t = time_span.start_time + i * step
+        k1 = fun(t, y)
+        k2 = fun(t + half_step, y + half_step * k1)
+        k3 = fun(t + half_step, y + half_step * k2)
+        k4 = fun(t + step, y + step * k3)
+        y = y + (step / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+    return y
@@ -14,6 +14,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Sequence
 
 import numpy as np
 
@@ -111,3 +112,19 @@ class PhysicalParametersGenerator(ABC):
             physically reasonable and safe operating configuration. Invalid parameter
             combinations could lead to numerical instabilities or unrealistic behavior.
         """
+
+    def generate_batch(self, n: int, rng: np.random.Generator) -> Sequence[PhysicalParameters]:
+        """
+        Generate n independent sets of physical parameters, e.g. one per vectorized environment.
+
+        The default implementation calls generate() n times; generators that can draw the
+        parameters of all the sets at once should override it.
+
+        Args:
+            n: Number of sets of physical parameters to generate.
+            rng: Random number generator for reproducible parameter sampling.
+
+        Returns:
+            Sequence[PhysicalParameters]: The n generated sets of physical parameters.
+        """
+        return [self.generate(rng) for _ in range(n)]
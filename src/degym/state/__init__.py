@@ -14,8 +14,8 @@
 
 from degym.state.initial_state_generator import InitialStateGenerator
 from degym.state.state import DAEParameters, DAEState, NonDAEParameters, State
-from degym.state.state_postprocessor import StatePostprocessor
-from degym.state.state_preprocessor import StatePreprocessor
+from degym.state.state_postprocessor import IdentityStatePostprocessor, StatePostprocessor
+from degym.state.state_preprocessor import IdentityStatePreprocessor, StatePreprocessor
 
 __all__ = [
     "DAEState",
@@ -25,4 +25,6 @@ __all__ = [
     "InitialStateGenerator",
     "StatePostprocessor",
     "StatePreprocessor",
+    "IdentityStatePostprocessor",
+    "IdentityStatePreprocessor",
 ]
@@ -12,35 +12,85 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import operator
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Callable, ClassVar, Optional
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 from pydantic import model_validator
 
 from degym.utils import PydanticBaseModel
 
 
-class DAEState(PydanticBaseModel):
-    """State of the DAE model."""
+def _make_field_values_getter(field_names: tuple[str, ...]) -> Callable[[Any], tuple]:
+    """Return a function reading the given attributes of an object, as a tuple."""
+    if not field_names:
+        return lambda _: ()
+    if len(field_names) == 1:
+        getter = operator.attrgetter(field_names[0])
+        return lambda instance: (getter(instance),)
+    return operator.attrgetter(*field_names)
+
+
+class _FieldArrayModel(PydanticBaseModel):
+    """
+    Base class of the parts of the state, laying out their fields in numpy arrays.
+
+    The fields of a concrete class are fixed when the class is defined, so the function reading
+    all of them at once is built once per class. The default to_np_array() and write_into() use
+    it to lay out the fields in their declaration order, without iterating over the fields on
+    every call. Subclasses can override both methods for a different layout.
+    """
+
+    _field_values: ClassVar[Callable[..., tuple]] = staticmethod(lambda _: ())
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the function reading the fields of the new class."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_values = staticmethod(_make_field_values_getter(tuple(cls.model_fields)))
+        # A subclass defining its own layout in to_np_array() only gets a write_into() copying it
+        if cls.to_np_array is not _FieldArrayModel.to_np_array and (
+            cls.write_into is _FieldArrayModel.write_into
+        ):
+            cls.write_into = _FieldArrayModel._write_to_np_array  # type: ignore[method-assign]
 
-    @abstractmethod
     def to_np_array(self) -> NDArray[np.floating]:
-        """Return state values as a concatenated numpy array."""
+        """Return the field values, in declaration order, as a concatenated numpy array."""
+        return np.array(self._field_values(self), dtype=np.float64)
+
+    def write_into(self, out: NDArray[np.floating]) -> None:
+        """
+        Write the values returned by to_np_array() into a preallocated numpy array.
+
+        Allocation-free counterpart of to_np_array(), used by the environment on every step.
+        For subclasses overriding only to_np_array(), it copies the result of to_np_array().
+        """
+        out[:] = self._field_values(self)
+
+    def _write_to_np_array(self, out: NDArray[np.floating]) -> None:
+        """Write the result of a custom to_np_array() into a preallocated numpy array."""
+        out[:] = self.to_np_array()
+
+
+class DAEState(_FieldArrayModel):
+    """State of the DAE model."""
 
     @classmethod
     @abstractmethod
     def from_np_array(cls, np_array: NDArray[np.floating]) -> "DAEState":
-        """Return an instance of the class initialized by a numpy array."""
+        """
+        Return an instance of the class initialized by a numpy array.
 
+        The environment reuses the array passed here across steps, so the instance must copy the
+        values it needs rather than keep a reference to `np_array`.
+        """
 
-class DAEParameters(PydanticBaseModel):
-    """Parameters of the DAE model."""
 
-    @abstractmethod
-    def to_np_array(self) -> NDArray[np.floating]:
-        """Return parameter values as a concatenated numpy array."""
+class DAEParameters(_FieldArrayModel):
+    """Parameters of the DAE model."""
 
     @classmethod
     @abstractmethod
@@ -48,13 +98,9 @@ class DAEParameters(PydanticBaseModel):
         """Return an instance of the class initialized by a numpy array."""
 
 
-class NonDAEParameters(PydanticBaseModel):
+class NonDAEParameters(_FieldArrayModel):
     """Parameters that are not part of the DAE model."""
 
-    @abstractmethod
-    def to_np_array(self) -> NDArray[np.floating]:
-        """Return parameter values as a concatenated numpy array."""
-
     @classmethod
     @abstractmethod
     def from_np_array(cls, np_array: NDArray[np.floating]) -> "NonDAEParameters":
@@ -105,9 +151,10 @@ class State(PydanticBaseModel):
             ValueError: If the pairwise union of DAEState, DAEParameters, and NonDAEParameters is
               not empty.
         """
-        overlapping_attributes = find_all_common_keys(
-            values.get("dae_state"), values.get("dae_params"), values.get("non_dae_params")
+        state_part_classes: tuple[type, ...] = tuple(
+            type(values.get(name)) for name in ("dae_state", "dae_params", "non_dae_params")
         )
+        overlapping_attributes = find_all_common_keys(*state_part_classes)
         if overlapping_attributes:
             raise ValueError(
                 "Attributes of DAEState, DAEParameters, and NonDAEParameters should not overlap."
@@ -115,14 +162,24 @@ class State(PydanticBaseModel):
             )
         return values
 
-    def to_np_array(self) -> NDArray[np.floating]:
-        """Return state values as a concatenated numpy array."""
+    def to_np_array(self, dtype: Optional[DTypeLike] = None) -> NDArray[np.floating]:
+        """
+        Return state values as a concatenated numpy array.
+
+        The state parts are integrated in float64. When the array is handed to a consumer that
+        does not need that precision, e.g. a policy, a narrower dtype such as np.float32 (or
+        ml_dtypes.bfloat16, if installed) reduces the amount of data passed along.
+
+        Args:
+            dtype: Optional dtype of the returned array. Defaults to the dtype of the parts.
+        """
         return np.concatenate(
             [
                 self.dae_state.to_np_array(),
                 self.dae_params.to_np_array(),
                 self.non_dae_params.to_np_array(),
-            ]
+            ],
+            dtype=dtype,
         )
 
     @classmethod
@@ -132,20 +189,26 @@ class State(PydanticBaseModel):
         raise NotImplementedError("This method is not implemented yet.")
 
 
-def find_all_common_keys(*pydantic_dataclasses: Any) -> set[str]:
+@functools.lru_cache(maxsize=None)
+def find_all_common_keys(*pydantic_model_classes: type) -> frozenset[str]:
     """
-    Find all the common keys between any pairs of the provided pydantic dataclasses.
+    Find all the common field names between any pairs of the provided pydantic model classes.
+
+    The field names are fixed per class, so the result is cached per tuple of classes and the
+    check only runs once for each combination of state classes.
 
     Args:
-        *pydantic_dataclasses: List of instances of pydantic dataclasses.
+        *pydantic_model_classes: List of pydantic model classes.
     """
-    common_keys = set()
-    num_dicts = len(pydantic_dataclasses)
-
-    for i in range(num_dicts):
-        for j in range(i + 1, num_dicts):
-            common_keys.update(
-                pydantic_dataclasses[i].model_fields_set & pydantic_dataclasses[j].model_fields_set
-            )
-
-    return common_keys
+    field_names = [
+        frozenset(getattr(model_class, "model_fields", {}))
+        for model_class in pydantic_model_classes
+    ]
+    common_keys: set[str] = set()
+    num_classes = len(field_names)
+
+    for i in range(num_classes):
+        for j in range(i + 1, num_classes):
+            common_keys.update(field_names[i] & field_names[j])
+
+    return frozenset(common_keys)
@@ -123,3 +123,16 @@ class StatePostprocessor(ABC):
             - Any transformations applied should reverse preprocessing operations and ensure
             the State object is in the expected format for downstream components.
         """
+
+
+class IdentityStatePostprocessor(StatePostprocessor):
+    """
+    StatePostprocessor returning the state unchanged, the most common case.
+
+    The environment recognizes this class and skips the call to postprocess_state() on every step.
+    Subclasses overriding postprocess_state() are called as usual.
+    """
+
+    def postprocess_state(self, state: State) -> State:
+        """Return the state unchanged."""
+        return state
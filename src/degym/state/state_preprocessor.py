@@ -124,3 +124,16 @@ class StatePreprocessor(ABC):
             mathematical relationships described by the differential equations.
             Most implementations simply return the state unchanged (identity operation).
         """
+
+
+class IdentityStatePreprocessor(StatePreprocessor):
+    """
+    StatePreprocessor returning the state unchanged, the most common case.
+
+    The environment recognizes this class and skips the call to preprocess_state() on every step.
+    Subclasses overriding preprocess_state() are called as usual.
+    """
+
+    def preprocess_state(self, state: State) -> State:
+        """Return the state unchanged."""
+        return state
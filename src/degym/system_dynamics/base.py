@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 
 class SystemDynamicsFn(ABC):
@@ -25,3 +25,18 @@ class SystemDynamicsFn(ABC):
     @abstractmethod
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         """Implements the system dynamics function."""
+
+    def as_callable(self) -> Callable[..., Any]:
+        """
+        Return the plain callable that integrators evaluate the dynamics with.
+
+        Integrators resolve this callable once, at construction, and call it directly on every
+        evaluation of the dynamics. Calling the returned function skips the lookup of
+        `__call__` on the instance type that `self(...)` performs every time. Subclasses can
+        override this method to return an accelerated version of the dynamics, e.g. one
+        compiled with a JIT compiler, without changing the integrators.
+
+        Returns:
+            A callable with the same signature as `__call__`.
+        """
+        return self.__call__
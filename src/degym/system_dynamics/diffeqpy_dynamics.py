@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from typing import MutableSequence, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -42,7 +43,7 @@ class DiffeqpySystemDynamicsFn(SystemDynamicsFn, ABC):
     @staticmethod
     @abstractmethod
     def __call__(  # NOTE: This is arg order assumed by diffeqpy - do not change
-        derivative: list[float],
+        derivative: Union[MutableSequence[float], NDArray[np.floating]],
         input_values: NDArray[np.floating],
         parameters: NDArray[np.floating],
         time: NDArray[np.floating],
@@ -51,6 +52,8 @@ class DiffeqpySystemDynamicsFn(SystemDynamicsFn, ABC):
         Signature of a diffeqpy system dynamics function.
 
         Uses state and parameters to update the values stored in 'derivative'.
-        Modifications are done in-place: derivative must be a list and not a numpy array,
-        or copies will be made instead of in-place modifications.
+        Modifications are done in-place, by assigning its elements: during integration,
+        derivative is the Julia vector of the solver, wrapped by juliacall, and in tests it can
+        be a list or a 1D float64 numpy array. It must not be rebound or converted (e.g. with
+        np.array), or the values will be written into a copy instead.
         """
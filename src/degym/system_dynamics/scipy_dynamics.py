@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -48,4 +49,52 @@ class ScipySystemDynamicsFn(SystemDynamicsFn, ABC):
             time: Time.
 
         The return value is a numpy array of shape (n_states,).
+
+        Note:
+            The returned array must be newly allocated on every call, not a buffer reused
+            across calls. The scipy solvers keep references to the derivatives they are given
+            (e.g. RK45 reuses the last one as the first stage of the next step), so writing the
+            next derivative into the same array silently corrupts the integration.
+        """
+
+    def bind(
+        self, parameters: NDArray[np.floating], action: NDArray[np.floating]
+    ) -> Callable[[float, NDArray[np.floating]], NDArray[np.floating]]:
+        """
+        Return the right-hand side `f(time, state)` of the ODE for fixed parameters and action.
+
+        The parameters and the action are constant over the time span of an integration, while
+        the right-hand side is evaluated many times. The default implementation closes over the
+        dynamics; subclasses can override it to unpack the parameters and precompute the terms
+        that only depend on them once per integration instead of once per evaluation.
+
+        Args:
+            parameters: Numpy array of shape (n_parameters,).
+            action: Numpy array of shape (n_actions,).
+
+        Returns:
+            A callable with the signature expected by the scipy solvers, `f(time, state)`.
+        """
+        system_dynamics = self.as_callable()
+        return lambda time, state: system_dynamics(state, parameters, action, time)
+
+    def bind_jacobian(
+        self, parameters: NDArray[np.floating], action: NDArray[np.floating]
+    ) -> Optional[Callable[[float, NDArray[np.floating]], NDArray[np.floating]]]:
+        """
+        Return the Jacobian `J(time, state)` of the right-hand side for fixed parameters and action.
+
+        The implicit methods (Radau, BDF, LSODA) need the Jacobian of the right-hand side with
+        respect to the state. By default they estimate it by finite differences, which costs
+        n_states evaluations of the dynamics each time it is updated, and is inaccurate in
+        stiff regions. Subclasses can override this method to return the analytic Jacobian.
+
+        Args:
+            parameters: Numpy array of shape (n_parameters,).
+            action: Numpy array of shape (n_actions,).
+
+        Returns:
+            A callable returning the Jacobian as an array of shape (n_states, n_states), or None
+            to let the solvers estimate it.
         """
+        return None
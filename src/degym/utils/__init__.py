@@ -12,11 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from degym.utils.non_overrideability import NoOverrideMeta, no_override
+from degym.utils.non_overrideability import NoOverrideMeta, NoOverrideMixin, no_override
 from degym.utils.pydantic_base_model import PydanticBaseModel
 
 __all__ = [
     "no_override",
     "PydanticBaseModel",
     "NoOverrideMeta",
+    "NoOverrideMixin",
 ]
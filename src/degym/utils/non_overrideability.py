@@ -13,12 +13,15 @@
 # limitations under the License.
 
 """
-This module provides a metaclass and a decorator to prevent overriding of methods and properties
-in subclasses. The main use-case is to fix the concrete implementations of the non-abstract methods
-and properties in the base classes, so that they cannot be overridden in the subclasses.
+This module provides a metaclass, a mixin and a decorator to prevent overriding of methods and
+properties in subclasses. The main use-case is to fix the concrete implementations of the
+non-abstract methods and properties in the base classes, so that they cannot be overridden in the
+subclasses.
 """
+
 from abc import ABCMeta
-from typing import Callable
+from collections.abc import Mapping
+from typing import Any, Callable, ClassVar
 
 
 class NoOverrideMeta(ABCMeta):
@@ -42,19 +45,67 @@ class NoOverrideMeta(ABCMeta):
             TypeError: If a method marked with _no_override in a base class is overridden
                        in the subclass.
         """
-        # Check for overridden methods
-        implemented_methods = [attr_name for (attr_name, attr_value) in dct.items()]
-        for base in bases:
-            for attr_name, attr_value in base.__dict__.items():
-                # In case attribute value is a property we should check for _no_override in the
-                # getter function of that property. For other cases we can check for _no_override in
-                # attribute itself.
-                target = attr_value.fget if isinstance(attr_value, property) else attr_value
-                if getattr(target, "_no_override", False) and attr_name in implemented_methods:
-                    raise TypeError(
-                        f"Method '{attr_name}' in {base.__name__} cannot be overridden in {name}"
-                    )
-        return super().__new__(cls, name, bases, dct)
+        _check_no_override(name, bases, dct)
+        new_class = super().__new__(cls, name, bases, dct)
+        new_class.__no_override_names__ = _no_override_names(bases, dct)  # type: ignore[attr-defined]
+        return new_class
+
+
+class NoOverrideMixin:
+    """
+    Mixin to prevent overriding of methods in subclasses.
+
+    Same check as NoOverrideMeta, run by __init_subclass__ instead of a metaclass. This avoids
+    metaclass conflicts with the other bases of a class; combine it with ABC where abstract
+    methods are needed.
+    """
+
+    __no_override_names__: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Ensure that methods/properties marked with _no_override in the base classes are not
+        overridden in the new subclass.
+
+        Args:
+            **kwargs: Keyword arguments of the class definition, passed on to the next class.
+
+        Raises:
+            TypeError: If a method marked with _no_override in a base class is overridden
+                       in the subclass.
+        """
+        super().__init_subclass__(**kwargs)
+        namespace = vars(cls)
+        _check_no_override(cls.__name__, cls.__bases__, namespace)
+        cls.__no_override_names__ = _no_override_names(cls.__bases__, namespace)
+
+
+def _check_no_override(name: str, bases: tuple, namespace: Mapping[str, Any]) -> None:
+    """Raise a TypeError if the namespace of a new class overrides a no_override name."""
+    # Every class checked here records the names marked with _no_override in it and in its
+    # bases, so the check is a single set intersection per base.
+    for base in bases:
+        overridden = namespace.keys() & getattr(base, "__no_override_names__", frozenset())
+        if overridden:
+            attr_name = sorted(overridden)[0]
+            raise TypeError(
+                f"Method '{attr_name}' in {base.__name__} cannot be overridden in {name}"
+            )
+
+
+def _no_override_names(bases: tuple, namespace: Mapping[str, Any]) -> frozenset[str]:
+    """Return the names marked with _no_override in a new class and in its bases."""
+    return frozenset(
+        attr_name for attr_name, attr_value in namespace.items() if _is_no_override(attr_value)
+    ).union(*(getattr(base, "__no_override_names__", frozenset()) for base in bases))
+
+
+def _is_no_override(attr_value: object) -> bool:
+    """Whether a class attribute is marked with _no_override."""
+    # In case attribute value is a property we should check for _no_override in the getter
+    # function of that property. For other cases we can check for _no_override in attribute itself.
+    target = attr_value.fget if isinstance(attr_value, property) else attr_value
+    return getattr(target, "_no_override", False)
 
 
 def no_override(method_or_property: Callable) -> Callable:
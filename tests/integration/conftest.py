@@ -12,43 +12,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from typing import Any
 
+import numpy as np
 import pytest
+from numpy.typing import NDArray
 
-
-@pytest.fixture(scope="function")
-def cstr_tutorial_env_config() -> dict[str, Any]:
-    return {
-        "env": "cstr_tutorial",
-        "env_config": {
-            "integrator": "scipy",
-            "integrator_config": {
-                "action_duration": 1,
-                "method": "RK45",
-                "rtol": 1e-6,
-                "atol": 1e-8,
+CSTR_TUTORIAL_ENV_CONFIG: dict[str, Any] = {
+    "env": "cstr_tutorial",
+    "env_config": {
+        "integrator": "scipy",
+        "integrator_config": {
+            "action_duration": 1,
+            "method": "RK45",
+            "rtol": 1e-6,
+            "atol": 1e-8,
+        },
+        "random_seed": 0,
+        "physical_parameters": {
+            "fixed_values": {
+                "c_a_0": 0.3,
+                "c_p": 3.25,
+                "e_a": 41570,
+                "e_b": 45727,
+                "f": 0.0025,
+                "dh": 4157,
+                "k_0_a": 50_000,
+                "k_0_b": 100_000,
+                "r": 8.314,
+                "t_0": 300,
+                "v": 0.2,
+                "q_max": 5000,
+                "max_timestep": 10,
             },
-            "random_seed": 0,
-            "physical_parameters": {
-                "fixed_values": {
-                    "c_a_0": 0.3,
-                    "c_p": 3.25,
-                    "e_a": 41570,
-                    "e_b": 45727,
-                    "f": 0.0025,
-                    "dh": 4157,
-                    "k_0_a": 50_000,
-                    "k_0_b": 100_000,
-                    "r": 8.314,
-                    "t_0": 300,
-                    "v": 0.2,
-                    "q_max": 5000,
-                    "max_timestep": 10,
-                },
-                "sampled_values": {
-                    "p": {"distribution": "choice", "choices": [780, 790], "size": 1}
-                },
+            "sampled_values": {
+                "p": {"distribution": "choice", "choices": [780, 790], "size": 1}
             },
-        }
+        },
     }
+}
+
+
+@pytest.fixture(scope="function")
+def cstr_tutorial_env_config() -> dict[str, Any]:
+    # Tests modify the config they receive, so each one gets its own copy.
+    return copy.deepcopy(CSTR_TUTORIAL_ENV_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def action_sequence() -> NDArray[np.floating]:
+    actions = np.random.default_rng(0).uniform(0, 1, size=100)
+    # The sequence is shared by all tests of the session, so it is made read-only.
+    actions.flags.writeable = False
+    return actions
@@ -13,26 +13,28 @@
 # limitations under the License.
 
 import numpy as np
-import pytest
 from degym_tutorials.cstr_tutorial.make_env import make_cstr_environment
 from numpy.typing import NDArray
 from tests import skip_if_not_diffeqpy
 
 
-@pytest.fixture
-def action_sequence() -> NDArray[np.floating]:
-    return np.random.uniform(0, 1, size=100)
-
-
 @skip_if_not_diffeqpy
-def test_compare_integrators(cstr_tutorial_env_config: dict, action_sequence: list[float]) -> None:
-    diffeqpy_env_config = cstr_tutorial_env_config["env_config"].copy()
-    diffeqpy_env_config["integrator"] = "diffeqpy"
-    diffeqpy_environment = make_cstr_environment(diffeqpy_env_config)
-
-    scipy_env_config = cstr_tutorial_env_config["env_config"].copy()
-    scipy_env_config["integrator"] = "scipy"
-    scipy_environment = make_cstr_environment(scipy_env_config)
+def test_compare_integrators(
+    cstr_tutorial_env_config: dict, action_sequence: NDArray[np.floating]
+) -> None:
+    # Both variants are built on top of the shared base config instead of copying and mutating
+    # it. The shared integrator config is written for scipy, diffeqpy gets its own.
+    base_env_config = cstr_tutorial_env_config["env_config"]
+    action_duration = base_env_config["integrator_config"]["action_duration"]
+
+    diffeqpy_environment = make_cstr_environment(
+        {
+            **base_env_config,
+            "integrator": "diffeqpy",
+            "integrator_config": {"action_duration": action_duration, "method": "Rodas5"},
+        }
+    )
+    scipy_environment = make_cstr_environment({**base_env_config, "integrator": "scipy"})
 
     diffeqpy_environment.reset()
     scipy_environment.reset()
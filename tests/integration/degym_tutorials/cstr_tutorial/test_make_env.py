@@ -21,6 +21,12 @@ from tests import skip_if_not_diffeqpy
 @skip_if_not_diffeqpy
 def test_make_cstr_environment_diffeqpy(cstr_tutorial_env_config: dict) -> None:
     cstr_tutorial_env_config["env_config"]["integrator"] = "diffeqpy"
+    # The shared integrator config is written for scipy, diffeqpy gets its own
+    action_duration = cstr_tutorial_env_config["env_config"]["integrator_config"]["action_duration"]
+    cstr_tutorial_env_config["env_config"]["integrator_config"] = {
+        "action_duration": action_duration,
+        "method": "Rodas5",
+    }
     env = make_cstr_environment(cstr_tutorial_env_config["env_config"])
     assert isinstance(env, CSTREnvironment)
 
@@ -29,3 +35,17 @@ def test_make_cstr_environment_scipy(cstr_tutorial_env_config: dict) -> None:
     cstr_tutorial_env_config["env_config"]["integrator"] = "scipy"
     env = make_cstr_environment(cstr_tutorial_env_config["env_config"])
     assert isinstance(env, CSTREnvironment)
+
+
+def test_make_cstr_environment_skips_identity_state_processors(
+    cstr_tutorial_env_config: dict,
+) -> None:
+    env = make_cstr_environment(cstr_tutorial_env_config["env_config"])
+    env.reset(seed=0)
+    env._state_preprocessor.preprocess_state = None  # would fail if called
+    env._state_postprocessor.postprocess_state = None  # would fail if called
+
+    env.step(env.action_space.sample())
+
+    assert env._skip_state_preprocessing
+    assert env._skip_state_postprocessing
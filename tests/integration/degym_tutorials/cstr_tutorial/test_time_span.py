@@ -31,3 +31,4 @@ def test_time_span() -> None:
 
     assert time_span.start_time == start_time
     assert time_span.end_time == start_time + action_duration
+    assert time_span.dt == time_span.end_time - time_span.start_time
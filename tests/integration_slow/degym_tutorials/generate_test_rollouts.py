@@ -17,17 +17,18 @@ Script to generate and save environment rollouts, to use in test_reproduce_rollo
 
 Requires a Hydra config YAML file to be saved in the directory degym/tests/integration_slow/configs.
 The name of this YAML file must be specified via `--config-name` when running this script.
-Additionally, the integrator (either 'diffeqpy' or 'scipy') must be specified via `+env_config.integrator`.
+Additionally, the integrator (either 'diffeqpy' or 'scipy') must be specified via the Hydra
+override `+env_config.integrator`.
 e.g.
     > uv run ./generate_test_rollouts.py --config-name 'cstr_tutorial' +env_config.integrator=diffeqpy
 """
 
+import argparse
 import warnings
 import numpy as np
 import pickle
 import os
-import hydra
-from hydra.core.hydra_config import HydraConfig
+from hydra import compose, initialize_config_dir
 from pathlib import Path
 
 from numpy.typing import NDArray
@@ -41,77 +42,129 @@ CONFIG_PATH = Path(__file__).parent.resolve() / "configs"
 DATA_PATH = Path(__file__).parent.resolve() / "data"
 
 
-def get_transition_dict(
-    dae_state_array: NDArray[np.floating],
-    observation_array: NDArray[np.floating],
-    info: dict[str, NDArray[np.floating] | float],
-    action: Optional[NDArray[np.floating] | float] = None,
-    reward: Optional[float] = None,
-    terminated: Optional[bool] = None,
-    truncated: Optional[bool] = None,
-) -> dict[str, Optional[NDArray[np.floating] | float]]:
-    """Return a dictionary containing all data related to this environment transition."""
-    data_dict = {
-        "dae_state": dae_state_array,
-        "observation": observation_array,
-        "action": action,
-        "reward": reward,
-        "terminated": terminated,
-        "truncated": truncated,
-    }
-    data_dict.update({f"info::{key}": value for key, value in info.items()})
-    return data_dict
-
-
-def generate_random_policy_rollout(environment: Environment) -> list[dict]:
+class RolloutRecorder:
+    """
+    Record the transitions of an episode, with one preallocated array per field.
+
+    The rollout is stored as a dictionary of arrays (a struct of arrays) rather than a list of
+    one dictionary per step: each field is a single contiguous allocation, written row by row,
+    and the pickled rollout is much smaller. Row i of "dae_state" and "observation" is the state
+    after i steps, while row i of "action", "reward", "terminated" and "truncated" belongs to
+    step i + 1. Each info key is stored as "info::key", with one entry per state.
+    """
+
+    def __init__(
+        self,
+        environment: Environment,
+        observation_array: NDArray[np.floating],
+        info: dict[str, NDArray[np.floating] | float],
+        max_timestep: int,
+    ):
+        """
+        Allocate the arrays of an episode of at most `max_timestep` steps and record its reset.
+
+        Args:
+            environment: Environment that was just reset.
+            observation_array: Observation returned by the reset.
+            info: Info returned by the reset.
+            max_timestep: Maximum number of steps of the episode.
+        """
+        self._environment = environment
+        self._n_steps = 0
+        action_space = environment.action_space
+        dae_state_shape = environment.state.dae_state.to_np_array().shape
+        self._arrays = {
+            "dae_state": np.empty((max_timestep + 1, *dae_state_shape)),
+            "observation": np.empty(
+                (max_timestep + 1, *observation_array.shape), dtype=observation_array.dtype
+            ),
+            "action": np.empty((max_timestep, *action_space.shape), dtype=action_space.dtype),
+            "reward": np.empty(max_timestep),
+            "terminated": np.zeros(max_timestep, dtype=bool),
+            "truncated": np.zeros(max_timestep, dtype=bool),
+        }
+        environment.state.dae_state.write_into(self._arrays["dae_state"][0])
+        self._arrays["observation"][0] = observation_array
+        self._info_lists = {key: [value] for key, value in info.items()}
+
+    def record_step(
+        self,
+        observation_array: NDArray[np.floating],
+        action: NDArray[np.floating] | float,
+        reward: float,
+        terminated: bool,
+        truncated: bool,
+        info: dict[str, NDArray[np.floating] | float],
+    ) -> None:
+        """Record the action and the outputs of an environment step."""
+        arrays = self._arrays
+        step = self._n_steps
+        self._environment.state.dae_state.write_into(arrays["dae_state"][step + 1])
+        arrays["observation"][step + 1] = observation_array
+        arrays["action"][step] = action
+        arrays["reward"][step] = reward
+        arrays["terminated"][step] = terminated
+        arrays["truncated"][step] = truncated
+        for key, value in info.items():
+            self._info_lists[key].append(value)
+        self._n_steps = step + 1
+
+    def to_dict(self) -> dict[str, NDArray]:
+        """Return the recorded rollout, as a dictionary of arrays trimmed to the steps taken."""
+        n_steps = self._n_steps
+        rollout = {
+            key: array[: n_steps + 1] if key in ("dae_state", "observation") else array[:n_steps]
+            for key, array in self._arrays.items()
+        }
+        rollout.update(
+            {f"info::{key}": np.asarray(values) for key, values in self._info_lists.items()}
+        )
+        return rollout
+
+
+def generate_random_policy_rollout(environment: Environment) -> dict[str, NDArray]:
     """
     Generate and return a full episode using a uniformly random policy.
 
     Args:
         environment: Environment object to use to generate a rollout.
     Returns:
-        List containing one dictionary for each environment step, with each dictionary
-            containing the action, the environment state, and all step outputs.
+        Dictionary with one array per field of the transitions (see RolloutRecorder),
+            containing the actions, the environment states, and all step outputs.
     """
     terminated = truncated = False
     observation_array, info = environment.reset()
-    dae_state_array = environment.state.dae_state.to_np_array()
-    transitions = [get_transition_dict(dae_state_array, observation_array, info=info)]
+    max_timestep = environment.state.non_dae_params.max_timestep
+    recorder = RolloutRecorder(environment, observation_array, info, max_timestep=max_timestep)
 
-    # Retrieve action_space object from environment property; fix random seed
+    # Retrieve action_space object from environment property; fix random seed. Sample the actions
+    # of the whole episode at once: for the bounded Box action space, this draws the same values
+    # from its generator as calling action_space.sample() on every step.
     action_space = environment.action_space
     action_space.seed(0)
+    actions = action_space.np_random.uniform(
+        action_space.low, action_space.high, size=(max_timestep, *action_space.shape)
+    ).astype(action_space.dtype)
 
-    # For each step, sample an action from action_space; store data dictionary
+    # For each step, take the next sampled action; record the step outputs
+    step = 0
     while not terminated and not truncated:
-        action = action_space.sample()
+        action = actions[step]
         observation_array, reward, terminated, truncated, info = environment.step(action)
-        dae_state_array = environment.state.dae_state.to_np_array()
-
-        transition_dict = get_transition_dict(
-            dae_state_array,
-            observation_array,
-            info=info,
-            action=action,
-            reward=reward,
-            terminated=terminated,
-            truncated=truncated,
-        )
-        transitions.append(transition_dict)
-    return transitions
+        recorder.record_step(observation_array, action, reward, terminated, truncated, info)
+        step += 1
+    return recorder.to_dict()
 
 
-@hydra.main(version_base=None, config_path=str(CONFIG_PATH), config_name=None)
-def generate_test_rollouts(config: DictConfig) -> None:
+def generate_test_rollouts(config: DictConfig, config_name: str) -> None:
     """
     Generate test rollouts for an environment.
 
-    Note:
-        - Environment configs specified by Hydra config file via the '--config-name' CLI argument.
-        - Integrator specified via `+env_config.integrator` CLI argument.
+    Args:
+        config: Composed Hydra config, with the integrator set in `env_config.integrator`.
+        config_name: Name of the config, used as the output directory name.
     """
     # Create output directory for the 'config_name' provided
-    config_name = HydraConfig.get().job.config_name
     output_dir = str(DATA_PATH / config_name)
     os.makedirs(output_dir, exist_ok=True)
 
@@ -129,9 +182,33 @@ def generate_test_rollouts(config: DictConfig) -> None:
 
     # Generate and save random policy rollout
     random_rollout = generate_random_policy_rollout(environment)
-    pickle.dump(random_rollout, open(f"{output_dir}/random_rollout_{integrator_name}.pkl", "wb"))
+    # Protocol 5+ serializes the numpy arrays from their buffers, without an intermediate copy;
+    # a 1 MiB buffer writes them out in a few large chunks
+    with open(
+        f"{output_dir}/random_rollout_{integrator_name}.pkl", "wb", buffering=1 << 20
+    ) as file:
+        pickle.dump(random_rollout, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def main() -> None:
+    """
+    Compose the config given on the command line and generate its test rollouts.
+
+    The config is composed with Hydra's compose API rather than `@hydra.main`, which would also
+    set up Hydra's logging, output directory and plugin discovery for a single pickle dump.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--config-name", required=True, help="Name of the YAML file in configs.")
+    parser.add_argument(
+        "overrides", nargs="*", help="Hydra overrides, e.g. +env_config.integrator=scipy."
+    )
+    args = parser.parse_args()
+
+    with initialize_config_dir(version_base=None, config_dir=str(CONFIG_PATH)):
+        config = compose(config_name=args.config_name, overrides=args.overrides)
+    generate_test_rollouts(config, args.config_name)
 
 
 if __name__ == "__main__":
     warnings.filterwarnings("ignore")
-    generate_test_rollouts()
+    main()
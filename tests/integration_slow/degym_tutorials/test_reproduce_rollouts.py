@@ -24,15 +24,15 @@ but will be run via pytest with the additional CLI argument `-m slow`, e.g.
 import pytest
 import os
 import pickle
-import numpy as np
 from pathlib import Path
+from numpy.typing import NDArray
 
 from omegaconf import OmegaConf
 import matplotlib.pyplot as plt
 
 from tests.utils import compare_dicts_with_tolerance
 from tests import skip_if_not_diffeqpy
-from generate_test_rollouts import get_transition_dict
+from generate_test_rollouts import RolloutRecorder
 
 from degym_tutorials.cstr_tutorial.make_env import make_cstr_environment
 
@@ -42,26 +42,22 @@ PLOTS_PATH = Path(__file__).parent.resolve() / "tmp" / "plots"
 
 
 def plot_rollouts_comparison(
-    true_transitions: list[dict], sampled_transitions: list[dict]
+    true_rollout: dict[str, NDArray], sampled_rollout: dict[str, NDArray]
 ) -> plt.Figure:
     """
     Generate plots for each state dimension, comparing the example (true)
-    rollout with the rollout steps sampled during this test run.
+    rollout with the rollout sampled during this test run.
     May be useful for debugging in the case that the tests fail.
 
     Args:
-        true_transitions: List of data dictionaries containing true rollout steps.
-        sampled_transitions: List of data dictionaries containing sampled rollout steps in this run.
+        true_rollout: Dictionary of arrays containing the true rollout.
+        sampled_rollout: Dictionary of arrays containing the rollout sampled in this run.
     Returns:
         Comparison plots, showing the evolution of each state dimension over the episode.
     """
-    # Retrieve series of states for both true and sampled rollouts
-    true_states = [step["dae_state"] for step in true_transitions]
-    sampled_states = [step["dae_state"] for step in sampled_transitions]
-
-    # Stack true and sampled states to make [num_timesteps, state_dim] arrays
-    true_stacked = np.stack(true_states, axis=0)[:, :-1]  # Exclude timestep
-    sampled_stacked = np.stack(sampled_states, axis=0)
+    # Retrieve [num_timesteps, state_dim] arrays of states for both true and sampled rollouts
+    true_stacked = true_rollout["dae_state"][:, :-1]  # Exclude timestep
+    sampled_stacked = sampled_rollout["dae_state"]
     state_dim = true_stacked.shape[-1]
 
     # Create and plot in subplots for each value dimension
@@ -76,7 +72,7 @@ def plot_rollouts_comparison(
 
 
 def _test_reproduce_rollouts(
-    config: OmegaConf, true_transitions: list[dict], plots_name: str
+    config: OmegaConf, true_rollout: dict[str, NDArray], plots_name: str
 ) -> None:
     """
     Test that environment reproduces behaviour over a full episode of interaction.
@@ -89,41 +85,31 @@ def _test_reproduce_rollouts(
         )
     environment = make_cstr_environment(config.env_config)
 
-    # Reset environment; store initial outputs
+    # Reset environment; record initial outputs
     observation_array, info = environment.reset()
-    dae_state_array = environment.state.dae_state.to_np_array()
-    sampled_transitions = [get_transition_dict(dae_state_array, observation_array, info=info)]
+    true_actions = true_rollout["action"]
+    recorder = RolloutRecorder(
+        environment, observation_array, info, max_timestep=len(true_actions)
+    )
 
-    # Iterate over true_transitions and apply true actions; store data dictionaries
-    for true_transition_dict in true_transitions[1:]:
-        action = true_transition_dict["action"]
+    # Apply the true actions; record the step outputs
+    for action in true_actions:
         observation_array, reward, terminated, truncated, info = environment.step(action)
-        dae_state_array = environment.state.dae_state.to_np_array()
-
-        sampled_transition_dict = get_transition_dict(
-            dae_state_array,
-            observation_array,
-            info=info,
-            action=action,
-            reward=reward,
-            terminated=terminated,
-            truncated=truncated,
-        )
-        sampled_transitions.append(sampled_transition_dict)
+        recorder.record_step(observation_array, action, reward, terminated, truncated, info)
+    sampled_rollout = recorder.to_dict()
 
     # Plot and save state rollouts of true and sampled episodes
-    fig = plot_rollouts_comparison(true_transitions, sampled_transitions)
+    fig = plot_rollouts_comparison(true_rollout, sampled_rollout)
     fig.suptitle(f"{plots_name}: test_reproduce_rollout")
 
     os.makedirs(PLOTS_PATH, exist_ok=True)
     fig.savefig(PLOTS_PATH / f"{plots_name}.png")
 
-    # Loop through data dictionaries and assert equal
-    for true_transition, sampled_transition in zip(true_transitions, sampled_transitions):
-        assert compare_dicts_with_tolerance(true_transition, sampled_transition), (
-            "True and sampled transitions do not match. "
-            f"See plot at {PLOTS_PATH / f'{plots_name}.png'} for comparison."
-        )
+    # Compare the arrays of all fields of the rollouts
+    assert compare_dicts_with_tolerance(true_rollout, sampled_rollout), (
+        "True and sampled rollouts do not match. "
+        f"See plot at {PLOTS_PATH / f'{plots_name}.png'} for comparison."
+    )
 
 
 @pytest.mark.slow
@@ -135,12 +121,13 @@ def test_reproduce_rollouts_scipy(config_name: str) -> None:
     Use the same random seed to sample an initial state, then follow a fixed sequence of actions.
     """
     # Load in rollout generated by generate_test_rollouts script
-    true_transitions = pickle.load(open(DATA_PATH / config_name / "random_rollout_scipy.pkl", "rb"))
+    with open(DATA_PATH / config_name / "random_rollout_scipy.pkl", "rb") as file:
+        true_rollout = pickle.load(file)
     # Load Hydra config file and instantiate environment
     config = OmegaConf.load(CONFIG_PATH / f"{config_name}.yaml")
     config.env_config.integrator = "scipy"
 
-    _test_reproduce_rollouts(config, true_transitions, f"{config_name}_scipy")
+    _test_reproduce_rollouts(config, true_rollout, f"{config_name}_scipy")
 
 
 @skip_if_not_diffeqpy
@@ -153,9 +140,10 @@ def test_reproduce_rollouts_diffeqpy(config_name: str) -> None:
     Use the same random seed to sample an initial state, then follow a fixed sequence of actions.
     """
     # Load in rollout generated by generate_test_rollouts script
-    true_transitions = pickle.load(open(DATA_PATH / config_name / "random_rollout_diffeqpy.pkl", "rb"))
+    with open(DATA_PATH / config_name / "random_rollout_diffeqpy.pkl", "rb") as file:
+        true_rollout = pickle.load(file)
     # Load Hydra config file and instantiate environment
     config = OmegaConf.load(CONFIG_PATH / f"{config_name}.yaml")
     config.env_config.integrator = "diffeqpy"
 
-    _test_reproduce_rollouts(config, true_transitions, f"{config_name}_diffeqpy")
+    _test_reproduce_rollouts(config, true_rollout, f"{config_name}_diffeqpy")
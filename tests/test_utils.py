@@ -23,10 +23,19 @@ from tests.utils import compare_dicts_with_tolerance
     "dict1, dict2, expected",
     [
         ({"a": 1.0}, {"a": 1.0}, True),
+        ({"a": 1.0}, {"a": 1.0 + 1e-6}, True),
+        ({"a": 1.0}, {"a": 1.1}, False),
+        ({"a": float("inf")}, {"a": float("inf")}, True),
+        ({"a": float("nan")}, {"a": float("nan")}, False),
+        ({"a": float("inf")}, {"a": -float("inf")}, False),
+        ({"a": True}, {"a": False}, False),
         ({"a": 1.0}, {"b": 1.0}, False),
         ({"a": 1.0}, {"a": 1.0, "b": None}, False),
         ({"b": None, "a": 1.0}, {"a": 1.0, "b": None}, True),
         ({"a": np.array([0.0, 1.0])}, {"a": np.array([0.0 - 1e-8, 1.0 + 1e-8])}, True),
+        ({"a": np.array([0, 1])}, {"a": np.array([0, 1])}, True),
+        ({"a": np.array([0, 1])}, {"a": np.array([0, 2])}, False),
+        ({"a": np.array([True, False])}, {"a": np.array([True, True])}, False),
     ]
 )
 def test_compare_dicts_with_tolerance(
@@ -21,9 +21,9 @@ from degym_tutorials.cstr_tutorial.action_concrete_classes import (
 from degym_tutorials.cstr_tutorial.state_concrete_classes import CSTRState
 
 
-def test_action_to_dae_action(cstr_state: CSTRState) -> None:
-    action_converter = CSTRActionConverter()
-
+def test_action_to_dae_action(
+    cstr_state: CSTRState, action_converter: CSTRActionConverter
+) -> None:
     action = CSTRAction(q_normalized=1.0)
     dae_action = action_converter.action_to_dae_action(action, cstr_state)
 
@@ -31,9 +31,9 @@ def test_action_to_dae_action(cstr_state: CSTRState) -> None:
     assert dae_action.q == action.q_normalized * cstr_state.non_dae_params.q_max
 
 
-def test_dae_action_to_action(cstr_state: CSTRState) -> None:
-    action_converter = CSTRActionConverter()
-
+def test_dae_action_to_action(
+    cstr_state: CSTRState, action_converter: CSTRActionConverter
+) -> None:
     dae_action = CSTRDAEAction(q=cstr_state.non_dae_params.q_max)
     action = action_converter.dae_action_to_action(dae_action, cstr_state)
 
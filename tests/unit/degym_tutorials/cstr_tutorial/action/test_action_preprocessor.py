@@ -15,11 +15,7 @@
 import pytest
 
 import gymnasium as gym
-from degym_tutorials.cstr_tutorial.action_concrete_classes import (
-    CSTRActionConverter,
-    CSTRActionPreprocessor,
-    CSTRActionRegulator,
-)
+from degym_tutorials.cstr_tutorial.action_concrete_classes import CSTRActionPreprocessor
 from degym_tutorials.cstr_tutorial.physical_parameters import (
     CSTRPhysicalParameters,
 )
@@ -28,11 +24,8 @@ from degym_tutorials.cstr_tutorial.state_concrete_classes import CSTRState
 
 def test_action_preprocessor_does_not_smoke(
     physical_parameters: CSTRPhysicalParameters,
+    action_preprocessor: CSTRActionPreprocessor,
 ) -> None:
-    action_preprocessor = CSTRActionPreprocessor(
-        action_converter=CSTRActionConverter(), action_regulator=CSTRActionRegulator()
-    )
-
     assert isinstance(action_preprocessor.action_space, gym.spaces.Box)
     assert action_preprocessor.action_space.low == -1
     assert action_preprocessor.action_space.high == 1
@@ -43,14 +36,8 @@ def test_preprocess_action(
     cstr_state: CSTRState,
     physical_parameters: CSTRPhysicalParameters,
     q_normalized: float,
+    action_preprocessor: CSTRActionPreprocessor,
 ) -> None:
-    action_regulator = CSTRActionRegulator()
-    action_converter = CSTRActionConverter()
-
-    action_preprocessor = CSTRActionPreprocessor(
-        action_converter=action_converter, action_regulator=action_regulator
-    )
-
     if q_normalized == 1.0:  # legal action
         preprocessed_action = action_preprocessor.preprocess_action(
             q_normalized, cstr_state
@@ -25,9 +25,8 @@ from degym_tutorials.cstr_tutorial.state_concrete_classes import CSTRState
 def test_is_legal(
     cstr_state: CSTRState,
     physical_parameters: CSTRPhysicalParameters,
+    action_regulator: CSTRActionRegulator,
 ) -> None:
-    action_regulator = CSTRActionRegulator()
-
     legal_action = CSTRDAEAction(q=physical_parameters.q_max)
     assert action_regulator.is_legal(legal_action, cstr_state)
 
@@ -38,8 +37,11 @@ def test_is_legal(
     assert not action_regulator.is_legal(illegal_action, cstr_state)
 
 
-def test_convert_to_legal_action(physical_parameters: CSTRPhysicalParameters, cstr_state: CSTRState) -> None:
-    action_regulator = CSTRActionRegulator()
+def test_convert_to_legal_action(
+    physical_parameters: CSTRPhysicalParameters,
+    cstr_state: CSTRState,
+    action_regulator: CSTRActionRegulator,
+) -> None:
     action = CSTRDAEAction(q=physical_parameters.q_max + 1)
     legal_action = action_regulator.convert_to_legal_action(action, state=cstr_state)
     assert legal_action.q == physical_parameters.q_max
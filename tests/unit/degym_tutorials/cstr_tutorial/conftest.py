@@ -12,41 +12,52 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from typing import Any
 
 import pytest
 
+from degym_tutorials.cstr_tutorial.action_concrete_classes import (
+    CSTRActionConverter,
+    CSTRActionPreprocessor,
+    CSTRActionRegulator,
+)
 from degym_tutorials.cstr_tutorial.physical_parameters import CSTRPhysicalParameters
 from degym_tutorials.cstr_tutorial.state_concrete_classes import CSTRState, CSTRDAEState, \
     CSTRDAEParameters, CSTRNonDAEParameters
 
 
+PHYSICAL_PARAMETERS_CONFIG: dict[str, Any] = {
+    "fixed_values": {
+        "f": 6,
+        "v": 7,
+        "c_a_0": 8,
+        "p": 9,
+        "c_p": 10,
+        "t_0": 11,
+        "dh": 13,
+        "k_0_a": 14,
+        "k_0_b": 15,
+        "e_a": 16,
+        "e_b": 17,
+        "r": 18,
+        "q_max": 19,
+        "max_timestep": 3,
+        },
+    "sampled_values": {},
+}
+
+
+# Fixtures holding frozen or never mutated objects are module-scoped, so they are validated once
+# per module. Fixtures that tests mutate stay function-scoped and return fresh objects.
 @pytest.fixture
 def physical_parameters_config() -> dict[str, Any]:
-    return {
-        "fixed_values": {
-            "f": 6,
-            "v": 7,
-            "c_a_0": 8,
-            "p": 9,
-            "c_p": 10,
-            "t_0": 11,
-            "dh": 13,
-            "k_0_a": 14,
-            "k_0_b": 15,
-            "e_a": 16,
-            "e_b": 17,
-            "r": 18,
-            "q_max": 19,
-            "max_timestep": 3,
-            },
-        "sampled_values": {},
-    }
+    return copy.deepcopy(PHYSICAL_PARAMETERS_CONFIG)
 
 
-@pytest.fixture
-def physical_parameters(physical_parameters_config: dict) -> CSTRPhysicalParameters:
-    fixed_values = physical_parameters_config["fixed_values"]
+@pytest.fixture(scope="module")
+def physical_parameters() -> CSTRPhysicalParameters:
+    fixed_values = PHYSICAL_PARAMETERS_CONFIG["fixed_values"]
     return CSTRPhysicalParameters(
         p=fixed_values["p"],
         c_a_0=fixed_values["c_a_0"],
@@ -65,11 +76,11 @@ def physical_parameters(physical_parameters_config: dict) -> CSTRPhysicalParamet
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cstr_dae_state() -> CSTRDAEState:
     return CSTRDAEState(c_a=1, c_b=2, T=3)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cstr_dae_params() -> CSTRDAEParameters:
     return CSTRDAEParameters(
         F=6,
@@ -102,3 +113,25 @@ def cstr_state(
         dae_params=cstr_dae_params,
         non_dae_params=cstr_non_dae_params
     )
+
+
+# The action converter, regulator and preprocessor hold no state of their own, so a single
+# instance of each is shared by the whole session.
+@pytest.fixture(scope="session")
+def action_converter() -> CSTRActionConverter:
+    return CSTRActionConverter()
+
+
+@pytest.fixture(scope="session")
+def action_regulator() -> CSTRActionRegulator:
+    return CSTRActionRegulator()
+
+
+@pytest.fixture(scope="session")
+def action_preprocessor(
+    action_converter: CSTRActionConverter,
+    action_regulator: CSTRActionRegulator,
+) -> CSTRActionPreprocessor:
+    return CSTRActionPreprocessor(
+        action_converter=action_converter, action_regulator=action_regulator
+    )
@@ -15,11 +15,7 @@
 import numpy as np
 import pytest
 
-from degym_tutorials.cstr_tutorial.action_concrete_classes import (
-    CSTRActionConverter,
-    CSTRActionPreprocessor,
-    CSTRActionRegulator,
-)
+from degym_tutorials.cstr_tutorial.action_concrete_classes import CSTRActionPreprocessor
 from degym_tutorials.cstr_tutorial.environment import CSTREnvironment
 from degym_tutorials.cstr_tutorial.extractors import (
     CSTRInfoExtractor,
@@ -60,13 +56,10 @@ def initial_state_generator() -> CSTRInitialStateGenerator:
 def state_preprocessor() -> CSTRStatePreprocessor:
     return CSTRStatePreprocessor()
 
-@pytest.fixture(scope="function")
-def action_preprocessor() -> CSTRActionPreprocessor:
-    action_regulator = CSTRActionRegulator()
-    action_converter = CSTRActionConverter()
-    return CSTRActionPreprocessor(action_converter=action_converter, action_regulator=action_regulator)
-
-@pytest.fixture(scope="function")
+# The integrator only holds the diffeqpy solver, which it reinitializes on every integration,
+# so it is shared by the tests of this module rather than rebuilt (and its problem recompiled)
+# per test.
+@pytest.fixture(scope="module")
 def integrator(cstr_system_dynamics: CSTRDiffeqpySystemDynamics) -> DiffeqpyIntegrator:
     integrator_config = DiffeqpyIntegratorConfig(action_duration=1.0)
     integrator = DiffeqpyIntegrator(
@@ -76,7 +69,7 @@ def integrator(cstr_system_dynamics: CSTRDiffeqpySystemDynamics) -> DiffeqpyInte
     return integrator
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def cstr_system_dynamics() -> CSTRDiffeqpySystemDynamics:
     return CSTRDiffeqpySystemDynamics()
 
@@ -116,8 +109,8 @@ def state_postprocessor() -> CSTRStatePostprocessor:
     return CSTRStatePostprocessor()
 
 
-@skip_if_not_diffeqpy
-def test_reset_environment(
+@pytest.fixture()
+def environment(
     physical_parameters_generator: CSTRPhysicalParametersGenerator,
     initial_state_generator: CSTRInitialStateGenerator,
     state_preprocessor: CSTRStatePreprocessor,
@@ -129,8 +122,8 @@ def test_reset_environment(
     truncated_extractor: CSTRTruncatedExtractor,
     terminated_extractor: CSTRTerminatedExtractor,
     state_postprocessor: CSTRStatePostprocessor,
-) -> None:
-    env = CSTREnvironment(
+) -> CSTREnvironment:
+    return CSTREnvironment(
         physical_parameters_generator=physical_parameters_generator,
         initial_state_generator=initial_state_generator,
         state_preprocessor=state_preprocessor,
@@ -144,47 +137,23 @@ def test_reset_environment(
         seed=0,
         state_postprocessor=state_postprocessor,
     )
-    obs, info = env.reset()
+
+
+# Reset and step are checked on one environment, so it is only built (and its first integration
+# compiled) once.
+@skip_if_not_diffeqpy
+def test_reset_and_step_environment(environment: CSTREnvironment) -> None:
+    obs, info = environment.reset()
     # Extract observation values from output array
     c_a, c_b, t = obs
 
-    physical_parameters = env._physical_parameters
-    assert c_a == env.state.dae_state.c_a / physical_parameters.c_a_0
+    physical_parameters = environment._physical_parameters
+    assert c_a == environment.state.dae_state.c_a / physical_parameters.c_a_0
     assert c_b == 0.0
     assert t == 1.0
     assert info == {}
 
-
-@skip_if_not_diffeqpy
-def test_step_environment(
-    physical_parameters_generator: CSTRPhysicalParametersGenerator,
-    initial_state_generator: CSTRInitialStateGenerator,
-    state_preprocessor: CSTRStatePreprocessor,
-    action_preprocessor: CSTRActionPreprocessor,
-    integrator: DiffeqpyIntegrator,
-    info_extractor: CSTRInfoExtractor,
-    observation_extractor: CSTRObservationExtractor,
-    reward_extractor: CSTRRewardExtractor,
-    truncated_extractor: CSTRTruncatedExtractor,
-    terminated_extractor: CSTRTerminatedExtractor,
-    state_postprocessor: CSTRStatePostprocessor,
-) -> None:
-    env = CSTREnvironment(
-        physical_parameters_generator=physical_parameters_generator,
-        initial_state_generator=initial_state_generator,
-        state_preprocessor=state_preprocessor,
-        action_preprocessor=action_preprocessor,
-        integrator=integrator,
-        info_extractor=info_extractor,
-        reward_extractor=reward_extractor,
-        observation_extractor=observation_extractor,
-        truncated_extractor=truncated_extractor,
-        terminated_extractor=terminated_extractor,
-        seed=0,
-        state_postprocessor=state_postprocessor,
-    )
-    physical_parameters = env._physical_parameters
-    obs, reward, terminated, truncated, info = env.step(action=1.0)
+    obs, reward, terminated, truncated, info = environment.step(action=1.0)
     # Extract observation values from output array
     c_a, c_b, t = obs
 
@@ -201,6 +170,6 @@ def test_step_environment(
     np.testing.assert_allclose(reward, c_b * physical_parameters.c_a_0)
 
     while not (terminated or truncated):
-        _, _, terminated, truncated, _ = env.step(action=1.0)
+        _, _, terminated, truncated, _ = environment.step(action=1.0)
     assert terminated  # max_timestep = 1 reached
     assert not truncated  # Never truncated
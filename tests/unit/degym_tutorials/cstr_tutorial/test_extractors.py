@@ -15,10 +15,13 @@
 import numpy as np
 import gymnasium as gym
 
+from degym.extractors import CompositeStepExtractor
+
 from degym_tutorials.cstr_tutorial.extractors import (
     CSTRInfoExtractor,
     CSTRObservationExtractor,
     CSTRRewardExtractor,
+    CSTRStepExtractor,
     CSTRTerminatedExtractor,
     CSTRTruncatedExtractor,
 )
@@ -40,14 +43,23 @@ def test_observation_extractor(
     assert obs.t == cstr_state.dae_state.T / physical_parameters.T_0
     np.testing.assert_array_equal(
         obs.to_np_array(),
-        [
-            cstr_state.dae_state.c_a / physical_parameters.c_a_0,
-            cstr_state.dae_state.c_b / physical_parameters.c_a_0,
-            cstr_state.dae_state.T / physical_parameters.T_0,
-        ],
+        np.array(
+            [
+                cstr_state.dae_state.c_a / physical_parameters.c_a_0,
+                cstr_state.dae_state.c_b / physical_parameters.c_a_0,
+                cstr_state.dae_state.T / physical_parameters.T_0,
+            ],
+            dtype=np.float32,
+        ),
+        strict=True,
     )
+    assert not hasattr(obs, "__dict__")
+    out = np.empty(3, dtype=np.float32)
+    obs.write_into(out)
+    np.testing.assert_array_equal(out, obs.to_np_array())
 
     assert isinstance(obs_extractor.observation_space, gym.spaces.Box)
+    assert obs_extractor.observation_space is obs_extractor.observation_space
     np.testing.assert_array_equal(obs_extractor.observation_space.low, np.array([0.0, 0.0, 0.0]))
     np.testing.assert_array_equal(
         obs_extractor.observation_space.high,
@@ -76,12 +88,13 @@ def test_terminated_extractor(cstr_state: CSTRState) -> None:
 
     assert terminated
 
-    cstr_state.non_dae_params.timestep = cstr_state.non_dae_params.max_timestep - 1
+    not_terminated_state = cstr_state.model_copy(deep=True)
+    not_terminated_state.non_dae_params.timestep = cstr_state.non_dae_params.max_timestep - 1
 
     terminated = terminated_extractor.extract_terminated(
     state=None,  # type: ignore[arg-type, unused-ignore]
     action=None,  # type: ignore[arg-type, unused-ignore]
-    next_state=cstr_state
+    next_state=not_terminated_state
     )
     assert  not terminated
 
@@ -104,3 +117,38 @@ def test_info_extractor(cstr_state: CSTRState) -> None:
         next_state=cstr_state
     )
     assert info == {}
+
+
+def test_step_extractor(cstr_state: CSTRState) -> None:
+    step_extractor = CSTRStepExtractor()
+    composite_step_extractor = CompositeStepExtractor(
+        reward_extractor=CSTRRewardExtractor(),
+        terminated_extractor=CSTRTerminatedExtractor(),
+        truncated_extractor=CSTRTruncatedExtractor(),
+    )
+    other_state = cstr_state.model_copy(
+        update={
+            "dae_state": cstr_state.dae_state.model_copy(update={"c_b": 7.0}),
+            "non_dae_params": cstr_state.non_dae_params.model_copy(update={"timestep": 0}),
+        }
+    )
+
+    for next_state, expected in ((cstr_state, (cstr_state.dae_state.c_b, True, False)),
+                                 (other_state, (7.0, False, False))):
+        for extractor in (step_extractor, composite_step_extractor):
+            assert extractor.extract_step(
+                state=None,  # type: ignore[arg-type, unused-ignore]
+                action=None,  # type: ignore[arg-type, unused-ignore]
+                next_state=next_state
+            ) == expected
+
+def test_extractors_have_no_instance_dict() -> None:
+    for extractor in (
+        CSTRObservationExtractor(),
+        CSTRRewardExtractor(),
+        CSTRTerminatedExtractor(),
+        CSTRTruncatedExtractor(),
+        CSTRInfoExtractor(),
+        CSTRStepExtractor(),
+    ):
+        assert not hasattr(extractor, "__dict__")
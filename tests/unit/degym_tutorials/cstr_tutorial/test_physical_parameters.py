@@ -97,6 +97,8 @@ class TestCSTRPhysicalParametersGenerator:
                 fixed_values["max_timestep"],
             ],
         )
+        # Without sampled values, the same frozen parameters are shared across episodes
+        assert generator.generate(rng=np.random.default_rng(1)) is physical_parameters
 
         # Test pydantic catches unwanted types
         with (pytest.raises(ValidationError)):
@@ -134,6 +136,30 @@ class TestCSTRPhysicalParametersGenerator:
         sampled_ea = [sampled.e_a for sampled in sampled_params]
         assert np.all(np.isclose(sampled_ea, physical_parameters_config["fixed_values"]["e_a"]))
 
+    def test_generate_batch(self, physical_parameters_config: dict) -> None:
+        fixed_values = physical_parameters_config["fixed_values"].copy()
+        del fixed_values["c_p"]
+        sampled_values = {"c_p": {"distribution": "uniform", "low": 0.1, "high": 0.2, "size": 1}}
+        generator_config = CSTRPhysicalParametersGeneratorConfig(
+            fixed_values=fixed_values, sampled_values=sampled_values
+        )
+        generator = CSTRPhysicalParametersGenerator(config=generator_config)
+
+        batch = generator.generate_batch(10, rng=np.random.default_rng(0))
+
+        # With a single sampled parameter, one draw for the batch matches one draw per call
+        rng = np.random.default_rng(0)
+        assert batch == [generator.generate(rng) for _ in range(10)]
+        assert len({physical_parameters.c_p for physical_parameters in batch}) == 10
+
+    def test_generate_batch_deterministic(self, physical_parameters_config: dict) -> None:
+        generator_config = CSTRPhysicalParametersGeneratorConfig(**physical_parameters_config)
+        generator = CSTRPhysicalParametersGenerator(config=generator_config)
+
+        batch = generator.generate_batch(3, rng=np.random.default_rng(0))
+
+        assert batch == [generator.generate(rng=np.random.default_rng(0))] * 3
+
     def test_generate_stochastic_wrong_keys(self, physical_parameters_config: dict) -> None:
         fixed_values = physical_parameters_config["fixed_values"]
         del fixed_values["p"]
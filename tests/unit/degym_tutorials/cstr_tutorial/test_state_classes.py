@@ -15,7 +15,10 @@
 from copy import deepcopy
 
 import numpy as np
+import pytest
+from pydantic import ValidationError
 
+from degym.state import DAEParameters, DAEState
 from degym_tutorials.cstr_tutorial.cstr_utils import reaction_rate
 from degym_tutorials.cstr_tutorial.physical_parameters import CSTRPhysicalParameters
 from degym_tutorials.cstr_tutorial.state_concrete_classes import (
@@ -29,31 +32,61 @@ from degym_tutorials.cstr_tutorial.state_concrete_classes import (
 )
 
 
-def test_cstrdaestate_to_numpy_array(cstr_dae_state: CSTRDAEState) -> None:
-    array = cstr_dae_state.to_np_array()
-    np.testing.assert_array_equal(array, [1, 2, 3])
+# (fixture name, class, expected array) of each part of the CSTR state
+STATE_PARTS = [
+    ("cstr_dae_state", CSTRDAEState, [1, 2, 3]),
+    ("cstr_dae_params", CSTRDAEParameters, [6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]),
+    ("cstr_non_dae_params", CSTRNonDAEParameters, [19, 20, 21]),
+]
 
-def test_cstrdaestate_from_numpy_array(cstr_dae_state: CSTRDAEState) -> None:
-    array = np.array([1, 2, 3])
-    assert CSTRDAEState.from_np_array(array) == cstr_dae_state
 
+@pytest.mark.parametrize("fixture_name, cls, expected", STATE_PARTS)
+def test_to_numpy_array(
+    request: pytest.FixtureRequest,
+    fixture_name: str,
+    cls: type[DAEState] | type[DAEParameters],
+    expected: list[int],
+) -> None:
+    array = request.getfixturevalue(fixture_name).to_np_array()
+    np.testing.assert_array_equal(array, expected)
 
-def test_cstrdaeparams_to_numpy_array(cstr_dae_params: CSTRDAEParameters) -> None:
-    array = cstr_dae_params.to_np_array()
-    np.testing.assert_array_equal(array, [6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17])
 
-def test_cstrdaeparams_from_numpy_array(cstr_dae_params: CSTRDAEParameters) -> None:
-    array = np.array([6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17])
-    assert CSTRDAEParameters.from_np_array(array) == cstr_dae_params
+@pytest.mark.parametrize("fixture_name, cls, expected", STATE_PARTS)
+def test_from_numpy_array(
+    request: pytest.FixtureRequest,
+    fixture_name: str,
+    cls: type[DAEState] | type[DAEParameters],
+    expected: list[int],
+) -> None:
+    assert cls.from_np_array(np.array(expected)) == request.getfixturevalue(fixture_name)
 
 
-def test_cstrnondaeparams_to_numpy_array(cstr_non_dae_params: CSTRNonDAEParameters) -> None:
-    array = cstr_non_dae_params.to_np_array()
-    np.testing.assert_array_equal(array, [19, 20, 21])
+@pytest.mark.parametrize("fixture_name, cls, expected", STATE_PARTS)
+def test_write_into(
+    request: pytest.FixtureRequest,
+    fixture_name: str,
+    cls: type[DAEState] | type[DAEParameters],
+    expected: list[int],
+) -> None:
+    state_part = request.getfixturevalue(fixture_name)
+    out = np.empty(len(expected))
+    state_part.write_into(out)
+    np.testing.assert_array_equal(out, state_part.to_np_array())
+
+
+def test_cstrdaeparams_is_frozen(cstr_dae_params: CSTRDAEParameters) -> None:
+    with pytest.raises(ValidationError):
+        cstr_dae_params.F = 0.0
+
+
+def test_cstrdaeparams_model_copy_update(cstr_dae_params: CSTRDAEParameters) -> None:
+    updated_params = cstr_dae_params.model_copy(update={"F": 0.5})
+    out = np.empty(12)
+    updated_params.write_into(out)
+    expected = [0.5, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17]
+    np.testing.assert_array_equal(updated_params.to_np_array(), expected)
+    np.testing.assert_array_equal(out, expected)
 
-def test_cstrnondaeparams_from_numpy_array(cstr_non_dae_params: CSTRNonDAEParameters) -> None:
-    array = np.array([19, 20, 21])
-    assert CSTRNonDAEParameters.from_np_array(array) == cstr_non_dae_params
 
 def test_deepcopy(cstr_state: CSTRState) -> None:
     new_state = deepcopy(cstr_state)
@@ -115,3 +148,16 @@ def test_initial_state_sampler() -> None:
         np.testing.assert_array_equal(
             expected_state.to_np_array(), sampled_state.to_np_array()
         )
+
+
+def test_initial_state_sampler_reuses_dae_params() -> None:
+    generator = CSTRInitialStateGenerator()
+    first_state = generator.generate(CSTRPhysicalParameters())
+    second_state = generator.generate(CSTRPhysicalParameters())
+    other_state = generator.generate(CSTRPhysicalParameters(V=0.4))
+
+    # Equal physical parameters share the frozen DAE parameters, but not the mutable parts
+    assert second_state.dae_params is first_state.dae_params
+    assert second_state.non_dae_params is not first_state.non_dae_params
+    assert second_state.dae_state is not first_state.dae_state
+    assert other_state.dae_params.V == 0.4
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import numpy as np
+import pytest
 
 from degym_tutorials.cstr_tutorial.action_concrete_classes import CSTRDAEAction
 from degym_tutorials.cstr_tutorial.cstr_utils import reaction_rate
@@ -26,8 +27,28 @@ from degym_tutorials.cstr_tutorial.state_concrete_classes import (
 from degym_tutorials.cstr_tutorial.system_dynamics.diffeqpy_dynamics import (
     CSTRDiffeqpySystemDynamics,
 )
+from degym_tutorials.cstr_tutorial.system_dynamics.scipy_dynamics import (
+    CSTRScipySystemDynamics,
+)
 
 
+@pytest.fixture
+def dae_parameters(physical_parameters: CSTRPhysicalParameters) -> CSTRDAEParameters:
+    return CSTRDAEParameters(
+        F=physical_parameters.F,
+        V=physical_parameters.V,
+        c_a_0=physical_parameters.c_a_0,
+        p=physical_parameters.p,
+        c_p=physical_parameters.c_p,
+        T_0=physical_parameters.T_0,
+        dh=physical_parameters.dh,
+        k_0_a=physical_parameters.k_0_a,
+        k_0_b=physical_parameters.k_0_b,
+        E_a_A=physical_parameters.e_a,
+        E_a_B=physical_parameters.e_b,
+        R=physical_parameters.R,
+    )
+
 
 def test_system_dynamics(physical_parameters: CSTRPhysicalParameters) -> None:
     """
@@ -107,3 +128,53 @@ def test_system_dynamics(physical_parameters: CSTRPhysicalParameters) -> None:
     np.testing.assert_array_almost_equal(
         derivative, [dc_a, dc_b, dt], decimal=16
     )
+
+
+def test_scipy_system_dynamics_matches_diffeqpy(
+    physical_parameters: CSTRPhysicalParameters, dae_parameters: CSTRDAEParameters
+) -> None:
+    dae_state = CSTRDAEState(
+        c_a=0.5 * physical_parameters.c_a_0,
+        c_b=0.3 * physical_parameters.c_a_0,
+        T=physical_parameters.T_0 + 20.0,
+    )
+    action = CSTRDAEAction(q=1500.0)
+
+    expected_derivative = np.zeros(3)
+    CSTRDiffeqpySystemDynamics()(
+        derivative=expected_derivative,
+        input_values=dae_state.to_np_array(),
+        parameters=np.concatenate([dae_parameters.to_np_array(), action.to_np_array()]),
+        time=np.array([]),
+    )
+
+    derivative = CSTRScipySystemDynamics().as_callable()(
+        dae_state.to_np_array(),
+        dae_parameters.to_np_array(),
+        action.to_np_array(),
+        0.0,
+    )
+
+    np.testing.assert_allclose(derivative, expected_derivative, rtol=1e-12)
+
+
+def test_scipy_system_dynamics_bind_jacobian(
+    physical_parameters: CSTRPhysicalParameters, dae_parameters: CSTRDAEParameters
+) -> None:
+    system_dynamics = CSTRScipySystemDynamics()
+    state = np.array([0.5 * physical_parameters.c_a_0, 0.1, physical_parameters.T_0 + 20.0])
+    parameters = dae_parameters.to_np_array()
+    action = CSTRDAEAction(q=1500.0).to_np_array()
+
+    jacobian = system_dynamics.bind_jacobian(parameters, action)(0.0, state)
+
+    # Central finite differences, with steps relative to each state variable
+    rhs = system_dynamics.bind(parameters, action)
+    expected = np.empty((3, 3))
+    for j in range(3):
+        step = 1e-6 * abs(state[j])
+        state_plus, state_minus = state.copy(), state.copy()
+        state_plus[j] += step
+        state_minus[j] -= step
+        expected[:, j] = (rhs(0.0, state_plus) - rhs(0.0, state_minus)) / (2 * step)
+    np.testing.assert_allclose(jacobian, expected, rtol=1e-5, atol=1e-9)
@@ -0,0 +1,47 @@
+# Copyright 2025 InstaDeep Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from degym.extractors import FixedSizeObservation
+
+
+@dataclass(frozen=True)
+class PointObservation(FixedSizeObservation):
+    _size = 2
+
+    x: float
+    y: float
+
+
+def test_fixed_size_observation() -> None:
+    observation = PointObservation(x=1.0, y=2.0)
+
+    array = observation.to_np_array()
+
+    np.testing.assert_array_equal(array, [1.0, 2.0])
+    assert array.shape == (2,)
+    assert array.dtype == np.float32
+    out = np.zeros((2, 2))
+    observation.write_into(out[1])
+    np.testing.assert_array_equal(out, [[0.0, 0.0], [1.0, 2.0]])
+
+
+def test_observation_array_protocol() -> None:
+    observation = PointObservation(x=1.0, y=2.0)
+
+    np.testing.assert_array_equal(np.asarray(observation), [1.0, 2.0])
+    assert np.asarray(observation, dtype=np.float64).dtype == np.float64
@@ -0,0 +1,66 @@
+# Copyright 2025 InstaDeep Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import gymnasium as gym
+import numpy as np
+import pytest
+
+from degym.extractors import ArrayObservation, LinearObservationExtractor
+
+
+def test_linear_observation_extractor() -> None:
+    observation_space = gym.spaces.Box(low=-np.inf, high=np.inf, shape=(2,))
+    extractor = LinearObservationExtractor(
+        spec=[("dae_state.c_a", 0.5, 0.0), ("dae_state.T", 0.01, -1.0)],
+        observation_space=observation_space,
+    )
+    state = SimpleNamespace(dae_state=SimpleNamespace(c_a=4.0, T=300.0))
+
+    observation = extractor.extract_observation(next_state=state)  # type: ignore[arg-type, unused-ignore]
+
+    np.testing.assert_allclose(observation.to_np_array(), [2.0, 2.0])
+    out = np.empty(2)
+    observation.write_into(out)
+    np.testing.assert_allclose(out, [2.0, 2.0])
+    assert extractor.observation_space is observation_space
+
+
+def test_linear_observation_extractor_single_field() -> None:
+    extractor = LinearObservationExtractor(
+        spec=[("c_a", 2.0, 1.0)],
+        observation_space=gym.spaces.Box(low=-np.inf, high=np.inf, shape=(1,)),
+    )
+
+    observation = extractor.extract_observation(next_state=SimpleNamespace(c_a=3.0))  # type: ignore[arg-type, unused-ignore]
+
+    np.testing.assert_array_equal(observation.to_np_array(), [7.0])
+
+
+def test_linear_observation_extractor_empty_spec() -> None:
+    with pytest.raises(ValueError):
+        LinearObservationExtractor(
+            spec=[], observation_space=gym.spaces.Box(low=0.0, high=1.0, shape=(0,))
+        )
+
+
+def test_array_observation_is_wrapped_without_copy() -> None:
+    values = np.array([1.0, 2.0], dtype=np.float32)
+    observation = ArrayObservation(values)
+
+    array = np.asarray(observation)
+
+    np.testing.assert_array_equal(array, values)
+    assert np.shares_memory(array, values)
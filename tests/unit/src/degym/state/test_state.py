@@ -0,0 +1,126 @@
+# Copyright 2025 InstaDeep Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from pydantic import ValidationError
+
+from degym.state import DAEParameters, DAEState, NonDAEParameters, State
+from degym.state.state import find_all_common_keys
+
+
+class PointDAEState(DAEState):
+    x: float
+
+    def to_np_array(self) -> NDArray[np.floating]:
+        return np.asarray([self.x])
+
+    @classmethod
+    def from_np_array(cls, np_array: NDArray[np.floating]) -> "PointDAEState":
+        return cls(x=np_array[0])
+
+
+class PointDAEParameters(DAEParameters):
+    k: float
+
+    def to_np_array(self) -> NDArray[np.floating]:
+        return np.asarray([self.k])
+
+    @classmethod
+    def from_np_array(cls, np_array: NDArray[np.floating]) -> "PointDAEParameters":
+        return cls(k=np_array[0])
+
+
+class PointNonDAEParameters(NonDAEParameters):
+    timestep: int = 0
+    x: float = 0.0
+
+    def to_np_array(self) -> NDArray[np.floating]:
+        return np.asarray([self.x, self.timestep])
+
+    @classmethod
+    def from_np_array(cls, np_array: NDArray[np.floating]) -> "PointNonDAEParameters":
+        return cls(x=np_array[0], timestep=int(np_array[1]))
+
+
+def test_find_all_common_keys() -> None:
+    common_keys = find_all_common_keys(PointDAEState, PointDAEParameters, PointNonDAEParameters)
+
+    assert common_keys == {"x"}
+    assert find_all_common_keys(PointDAEState, PointDAEParameters) == frozenset()
+
+
+def test_state_overlapping_attributes_with_defaults() -> None:
+    # The overlap is detected from the class fields, even when the field keeps its default
+    with pytest.raises(ValidationError, match="should not overlap"):
+        State(
+            dae_state=PointDAEState(x=1.0),
+            dae_params=PointDAEParameters(k=2.0),
+            non_dae_params=PointNonDAEParameters(),
+        )
+
+
+class PendulumDAEParameters(DAEParameters):
+    length: float
+    mass: float
+    n_links: int
+
+    @classmethod
+    def from_np_array(cls, np_array: NDArray[np.floating]) -> "PendulumDAEParameters":
+        return cls(length=np_array[0], mass=np_array[1], n_links=int(np_array[2]))
+
+
+def test_default_to_np_array_and_write_into() -> None:
+    dae_params = PendulumDAEParameters(length=1.5, mass=0.2, n_links=2)
+
+    array = dae_params.to_np_array()
+    out = np.zeros((2, 3))
+    dae_params.write_into(out[1])
+
+    np.testing.assert_array_equal(array, [1.5, 0.2, 2.0])
+    assert array.dtype == np.float64
+    np.testing.assert_array_equal(out, [[0.0, 0.0, 0.0], [1.5, 0.2, 2.0]])
+
+
+def test_write_into_follows_custom_to_np_array() -> None:
+    # PointNonDAEParameters lays out its fields in reverse order, in to_np_array only
+    non_dae_params = PointNonDAEParameters(timestep=3, x=0.5)
+    out = np.empty(2)
+
+    non_dae_params.write_into(out)
+
+    np.testing.assert_array_equal(out, [0.5, 3.0])
+
+
+class StepNonDAEParameters(NonDAEParameters):
+    timestep: int = 0
+
+    @classmethod
+    def from_np_array(cls, np_array: NDArray[np.floating]) -> "StepNonDAEParameters":
+        return cls(timestep=int(np_array[0]))
+
+
+def test_state_to_np_array_dtype() -> None:
+    state = State(
+        dae_state=PointDAEState(x=1.0),
+        dae_params=PendulumDAEParameters(length=1.5, mass=0.2, n_links=2),
+        non_dae_params=StepNonDAEParameters(timestep=4),
+    )
+
+    array = state.to_np_array(dtype=np.float32)
+
+    assert array.dtype == np.float32
+    np.testing.assert_allclose(array, [1.0, 1.5, 0.2, 2.0, 4.0])
+    assert state.to_np_array().dtype == np.float64
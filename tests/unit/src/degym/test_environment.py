@@ -45,6 +45,13 @@ def test_non_overridability_of__extract_step_outputs() -> None:
                 pass
 
 
+def test_non_overridability_of__step_pipeline() -> None:
+    with pytest.raises(TypeError):
+        class SubClass(Environment):
+            def _step_pipeline(self, *args: Any, **kwargs: Any) -> Any:
+                pass
+
+
 def test_non_overridability_of_state() -> None:
     with pytest.raises(TypeError):
         class SubClass(Environment):
@@ -14,7 +14,7 @@
 
 import pytest
 
-from degym.utils import NoOverrideMeta, no_override
+from degym.utils import NoOverrideMeta, NoOverrideMixin, no_override
 
 class BaseClass(metaclass=NoOverrideMeta):
     @no_override
@@ -46,3 +46,41 @@ def test_no_override() -> None:
     class AnotherSubClass(BaseClass):
         def method_overridable(self) -> None:
             pass
+    # Test 3: Overriding a method which is decorated with no_override in an indirect base class.
+    with pytest.raises(TypeError):
+        class AGrandSubClass(AnotherSubClass):
+            def method_non_overridable(self) -> None:
+                pass
+
+
+class MixinBaseClass(NoOverrideMixin):
+    @no_override
+    def method_non_overridable(self) -> None:
+        """This is the method which is decorated with no_override."""
+        pass
+
+    @property
+    @no_override
+    def property_non_overridable(self) -> None:
+        """This is the property which is decorated with no_override."""
+        pass
+
+
+def test_no_override_mixin() -> None:
+    """Test the no_override decorator on a class using NoOverrideMixin instead of the metaclass."""
+    with pytest.raises(TypeError):
+        class ASubClass(MixinBaseClass):
+            def method_non_overridable(self) -> None:
+                pass
+    with pytest.raises(TypeError):
+        class AnotherSubClass(MixinBaseClass):
+            @property
+            def property_non_overridable(self) -> None:
+                pass
+    class AThirdSubClass(MixinBaseClass):
+        def method_overridable(self) -> None:
+            pass
+    with pytest.raises(TypeError):
+        class AGrandSubClass(AThirdSubClass):
+            def method_non_overridable(self) -> None:
+                pass
@@ -134,3 +134,45 @@ def test_diffeqpy_integrate(
         atol=1e-6,
         rtol=0.0,
     )
+
+
+@skip_if_not_diffeqpy
+def test_diffeqpy_integrate_consecutive_calls(
+    true_solution_rc: Callable[[float, float], list[float]],
+    resistance: float,
+    capacity: float,
+    rc_diffeqpy_dynamics_fn: DiffeqpySystemDynamicsFn,
+) -> None:
+    integrator = DiffeqpyIntegrator(
+        system_dynamics=rc_diffeqpy_dynamics_fn,
+        integrator_config=DiffeqpyIntegratorConfig(action_duration=1.0),
+    )
+    u_0 = 1.5
+    values = RCState(u=u_0, i=u_0 / resistance).to_np_array()
+
+    for step in range(3):
+        values = integrator.integrate(
+            input_values=values,
+            parameters=np.array([resistance, capacity]),
+            action=np.array([]),
+            time_span=TimeSpan(start_time=float(step), end_time=float(step + 1)),
+        )
+
+    np.testing.assert_allclose(
+        values,
+        np.asarray(true_solution_rc(3.0, u_0)),
+        atol=1e-6,
+        rtol=0.0,
+    )
+
+
+@skip_if_not_diffeqpy
+def test_diffeqpy_integrator_unknown_method(
+    rc_diffeqpy_dynamics_fn: DiffeqpySystemDynamicsFn,
+) -> None:
+    with pytest.raises(ValueError, match="Unknown diffeqpy method"):
+        DiffeqpyIntegrator(
+            system_dynamics=rc_diffeqpy_dynamics_fn,
+            integrator_config=DiffeqpyIntegratorConfig(action_duration=1.0, method="NotAMethod"),
+        )
+
@@ -129,3 +129,247 @@ def test_scipy_integrate(
         atol=1e-6,
         rtol=0.0,
     )
+
+
+def test_scipy_integrate_random_cases(
+    true_solution_rc: Callable[[float, float], list[float]],
+    resistance: float,
+    capacity: float,
+    rc_scipy_dynamics_fn: ScipySystemDynamicsFn,
+) -> None:
+    # The time span is given per call, so a single integrator covers a batch of random
+    # (start_time, duration, u_0) cases drawn at once.
+    integrator = ScipyIntegrator(
+        system_dynamics=rc_scipy_dynamics_fn,
+        integrator_config=ScipyIntegratorConfig(action_duration=1.0),
+    )
+    cases = np.random.default_rng(0).uniform([0.0, 1.0, 0.5], [2.0, 10.0, 2.0], size=(64, 3))
+
+    for start_time, duration, u_0 in cases:
+        next_values = integrator.integrate(
+            input_values=np.array([u_0]),
+            parameters=np.array([resistance, capacity]),
+            action=np.array([]),
+            time_span=TimeSpan(start_time=start_time, end_time=start_time + duration),
+        )
+
+        np.testing.assert_allclose(
+            next_values,
+            np.asarray(true_solution_rc(duration, u_0)),
+            atol=1e-6,
+            rtol=0.0,
+        )
+
+
+def test_scipy_integrate_into_out_buffer(
+    resistance: float,
+    capacity: float,
+    rc_scipy_dynamics_fn: ScipySystemDynamicsFn,
+) -> None:
+    integrator = ScipyIntegrator(
+        system_dynamics=rc_scipy_dynamics_fn,
+        integrator_config=ScipyIntegratorConfig(action_duration=1.0),
+    )
+    kwargs: dict[str, Any] = dict(
+        input_values=np.array([1.5]),
+        parameters=np.array([resistance, capacity]),
+        action=np.array([]),
+        time_span=TimeSpan(start_time=0.0, end_time=1.0),
+    )
+    out = np.empty(1)
+
+    next_values = integrator.integrate(**kwargs, out=out)
+
+    assert next_values is out
+    np.testing.assert_array_equal(out, integrator.integrate(**kwargs))
+
+
+def test_scipy_integrator_uses_system_dynamics_callable(
+    resistance: float,
+    capacity: float,
+) -> None:
+    calls = []
+
+    class CountingRCSciPySystemDynamicsFn(RCSciPySystemDynamicsFn):
+        def as_callable(self) -> Callable[..., Any]:
+            fn = super().as_callable()
+
+            def counting_fn(*args: Any) -> NDArray[np.floating]:
+                calls.append(args)
+                return fn(*args)
+
+            return counting_fn
+
+    integrator = ScipyIntegrator(
+        system_dynamics=CountingRCSciPySystemDynamicsFn(resistance=resistance, capacity=capacity),
+        integrator_config=ScipyIntegratorConfig(action_duration=1.0),
+    )
+    integrator.integrate(
+        input_values=np.array([1.5]),
+        parameters=np.array([resistance, capacity]),
+        action=np.array([]),
+        time_span=TimeSpan(start_time=0.0, end_time=1.0),
+    )
+
+    assert len(calls) > 0
+
+
+class VectorizedRCSciPySystemDynamicsFn(ScipySystemDynamicsFn):
+    @staticmethod
+    def __call__(
+        state: NDArray[np.floating],
+        parameters: NDArray[np.floating],
+        action: NDArray[np.floating],
+        time: float,
+    ) -> NDArray[np.floating]:
+        resistance, capacity = parameters
+        return -state / (resistance * capacity)
+
+
+def test_scipy_integrate_vectorized(
+    true_solution_rc: Callable[[float, float], list[float]],
+    resistance: float,
+    capacity: float,
+) -> None:
+    integrator = ScipyIntegrator(
+        system_dynamics=VectorizedRCSciPySystemDynamicsFn(),
+        integrator_config=ScipyIntegratorConfig(
+            action_duration=5.0, method="BDF", vectorized=True
+        ),
+    )
+
+    next_values = integrator.integrate(
+        input_values=np.array([1.5]),
+        parameters=np.array([resistance, capacity]),
+        action=np.array([]),
+        time_span=TimeSpan(start_time=0.0, end_time=5.0),
+    )
+
+    np.testing.assert_allclose(
+        next_values,
+        np.asarray(true_solution_rc(5.0, 1.5)),
+        atol=1e-6,
+        rtol=0.0,
+    )
+
+
+@pytest.mark.parametrize("method", ["RK45", "LSODA"])
+def test_scipy_integrate_step_size_config(
+    true_solution_rc: Callable[[float, float], list[float]],
+    method: str,
+    resistance: float,
+    capacity: float,
+) -> None:
+    integrator = ScipyIntegrator(
+        system_dynamics=VectorizedRCSciPySystemDynamicsFn(),
+        integrator_config=ScipyIntegratorConfig(
+            action_duration=5.0, method=method, max_step=0.5, first_step=1e-3
+        ),
+    )
+
+    next_values = integrator.integrate(
+        input_values=np.array([1.5]),
+        parameters=np.array([resistance, capacity]),
+        action=np.array([]),
+        time_span=TimeSpan(start_time=0.0, end_time=5.0),
+    )
+
+    np.testing.assert_allclose(
+        next_values,
+        np.asarray(true_solution_rc(5.0, 1.5)),
+        atol=1e-6,
+        rtol=0.0,
+    )
+
+
+def test_scipy_integrate_rk4(
+    true_solution_rc: Callable[[float, float], list[float]],
+    resistance: float,
+    capacity: float,
+) -> None:
+    integrator = ScipyIntegrator(
+        system_dynamics=VectorizedRCSciPySystemDynamicsFn(),
+        integrator_config=ScipyIntegratorConfig(action_duration=1.0, method="RK4", n_substeps=100),
+    )
+
+    next_values = integrator.integrate(
+        input_values=np.array([1.5]),
+        parameters=np.array([resistance, capacity]),
+        action=np.array([]),
+        time_span=TimeSpan(start_time=0.0, end_time=1.0),
+    )
+
+    np.testing.assert_allclose(
+        next_values, np.asarray(true_solution_rc(1.0, 1.5)), atol=1e-8, rtol=0.0
+    )
+
+
+@pytest.mark.parametrize("method", ["RK45", "Radau", "BDF"])
+def test_scipy_integrate_uses_bind_jacobian(
+    true_solution_rc: Callable[[float, float], list[float]],
+    method: str,
+    resistance: float,
+    capacity: float,
+) -> None:
+    calls = []
+
+    class JacobianRCSciPySystemDynamicsFn(VectorizedRCSciPySystemDynamicsFn):
+        def bind_jacobian(
+            self, parameters: NDArray[np.floating], action: NDArray[np.floating]
+        ) -> Callable[[float, NDArray[np.floating]], NDArray[np.floating]]:
+            resistance, capacity = parameters
+
+            def jacobian(time: float, state: NDArray[np.floating]) -> NDArray[np.floating]:
+                calls.append(time)
+                return np.array([[-1.0 / (resistance * capacity)]])
+
+            return jacobian
+
+    integrator = ScipyIntegrator(
+        system_dynamics=JacobianRCSciPySystemDynamicsFn(),
+        integrator_config=ScipyIntegratorConfig(action_duration=1.0, method=method),
+    )
+
+    next_values = integrator.integrate(
+        input_values=np.array([1.5]),
+        parameters=np.array([resistance, capacity]),
+        action=np.array([]),
+        time_span=TimeSpan(start_time=0.0, end_time=1.0),
+    )
+
+    np.testing.assert_allclose(
+        next_values, np.asarray(true_solution_rc(1.0, 1.5)), atol=1e-5, rtol=0.0
+    )
+    # Only the implicit methods use the Jacobian
+    assert (len(calls) > 0) == (method != "RK45")
+
+
+def test_scipy_integrator_unknown_method(rc_scipy_dynamics_fn: ScipySystemDynamicsFn) -> None:
+    with pytest.raises(ValueError, match="Unknown scipy method"):
+        ScipyIntegrator(
+            system_dynamics=rc_scipy_dynamics_fn,
+            integrator_config=ScipyIntegratorConfig(action_duration=1.0, method="Rodas5"),
+        )
+
+
+def test_scipy_integrator_mode() -> None:
+    integrator = ScipyIntegrator(
+        system_dynamics=VectorizedRCSciPySystemDynamicsFn(),
+        integrator_config=ScipyIntegratorConfig(action_duration=5.0),
+    )
+    integrate_kwargs = dict(
+        input_values=np.array([1.5]),
+        parameters=np.array([5.0, 0.1]),
+        action=np.array([]),
+        time_span=TimeSpan(start_time=0.0, end_time=5.0),
+    )
+    assert integrator.mode == "eval"
+    eval_values = integrator.integrate(**integrate_kwargs)
+
+    integrator.mode = "train"
+    train_values = integrator.integrate(**integrate_kwargs)
+
+    assert not np.array_equal(train_values, eval_values)
+    np.testing.assert_allclose(train_values, eval_values, atol=1e-4, rtol=0.0)
+    with pytest.raises(ValueError, match="Unknown mode"):
+        integrator.mode = "test"
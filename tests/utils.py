@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+
 import numpy as np
 
 from loguru import logger
@@ -58,11 +60,40 @@ def compare_dicts_with_tolerance(
             )
             return False
 
-        # Types are same and are one of (array, float, bool, None). Handle None case:
-        if value1 is None and value2 is None:
+        # Types are same and are one of (array, float, bool, None). Identical values, including
+        # two None, are equal:
+        if value1 is value2:
+            continue
+
+        # Types are same and are one of (array, float, bool). Scalars are compared directly
+        # rather than wrapped into 0-d arrays:
+        if isinstance(value1, float) and isinstance(value2, float):
+            if not math.isclose(value1, value2, rel_tol=rtol, abs_tol=atol):
+                logger.info(
+                    f"Dict values not equal for key = '{key}': ({value1}, {value2})."
+                )
+                return False
+            continue
+
+        if isinstance(value1, bool) and isinstance(value2, bool):
+            if value1 != value2:
+                logger.info(
+                    f"Dict values not equal for key = '{key}': ({value1}, {value2})."
+                )
+                return False
+            continue
+
+        # Bool and integer arrays that are exactly equal are also close, so skip np.allclose:
+        if (
+            isinstance(value1, np.ndarray)
+            and isinstance(value2, np.ndarray)
+            and value1.dtype == value2.dtype
+            and value1.shape == value2.shape
+            and value1.dtype.kind in "biu"
+            and np.array_equal(value1, value2)
+        ):
             continue
 
-        # Types are same and are one of (array, float, bool). Handle all cases:
         if not np.allclose(value1, value2, atol=atol, rtol=rtol):
             logger.info(
                 f"Dict values not equal for key = '{key}': ({value1}, {value2})."